@@ -10,8 +10,8 @@ This implementation uses in-memory storage (dictionary). In production,
 this could be backed by a database, Redis, or other persistent storage.
 """
 
-from typing import Dict, List, Optional
-from agentpay.models import Agent
+from typing import Any, Dict, List, Optional
+from agentpay.models import Agent, Policy
 
 
 class AgentRegistry:
@@ -85,6 +85,42 @@ class AgentRegistry:
         self._agents[agent.agent_id] = agent
         return agent
     
+    def register_agents(self, agents: List[Agent]) -> List[Agent]:
+        """Register several new agents in one step.
+        
+        All IDs are validated before any agent is stored, so either every
+        agent is registered or none are.
+        
+        Args:
+            agents (List[Agent]): The agents to register
+            
+        Returns:
+            List[Agent]: The registered agents (same instances, same order)
+            
+        Raises:
+            ValueError: If any ID is already registered or repeated in the batch
+            
+        Example:
+            ```python
+            registry = AgentRegistry()
+            registry.register_agents([
+                Agent(agent_id="agent-1"),
+                Agent(agent_id="agent-2"),
+            ])
+            print(registry.count_agents())  # 2
+            ```
+        """
+        new_agents = {agent.agent_id: agent for agent in agents}
+        if len(new_agents) != len(agents):
+            raise ValueError("Duplicate agent IDs in batch")
+        
+        existing = new_agents.keys() & self._agents.keys()
+        if existing:
+            raise ValueError(f"Agent with ID {min(existing)} already exists")
+        
+        self._agents.update(new_agents)
+        return agents
+    
     def get_agent(self, agent_id: str) -> Optional[Agent]:
         """Retrieve an agent by ID.
         
@@ -92,7 +128,9 @@ class AgentRegistry:
             agent_id (str): The unique ID of the agent to retrieve
             
         Returns:
-            Optional[Agent]: The agent if found, None otherwise
+            Optional[Agent]: The stored agent if found, None otherwise. This is
+                the live instance, not a copy, so later ledger and policy
+                changes show up on it without fetching it again.
             
         Example:
             ```python
@@ -102,7 +140,7 @@ class AgentRegistry:
             
             # Retrieve existing agent
             found = registry.get_agent("agent-1")
-            assert found is not None
+            assert found is agent
             
             # Try to get non-existent agent
             not_found = registry.get_agent("agent-999")
@@ -172,6 +210,42 @@ class AgentRegistry:
         self._agents[agent.agent_id] = agent
         return agent
     
+    def update_policy(self, agent_id: str, **changes: Any) -> Agent:
+        """Change fields of a registered agent's policy.
+        
+        Unlike update_agent, this doesn't need the caller to fetch the agent
+        and store it back. The current policy merged with ``changes`` is
+        validated as a whole, and the agent's policy is replaced only if
+        that succeeds.
+        
+        Args:
+            agent_id (str): The ID of the agent whose policy to change
+            **changes: Policy fields to set (e.g. ``paused=True``)
+        
+        Returns:
+            Agent: The updated agent (same instance, with a new Policy)
+        
+        Raises:
+            ValueError: If no agent with this ID exists, a field is not a
+                Policy field, or a value fails validation (pydantic's
+                ValidationError is a ValueError)
+        
+        Example:
+            ```python
+            registry.update_policy("agent-1", max_per_transaction=1000, paused=True)
+            ```
+        """
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            raise ValueError(f"Agent with ID {agent_id} does not exist")
+        
+        unknown = changes.keys() - Policy.model_fields.keys()
+        if unknown:
+            raise ValueError(f"Unknown policy field(s): {', '.join(sorted(unknown))}")
+        
+        agent.policy = Policy.model_validate({**agent.policy.model_dump(), **changes})
+        return agent
+    
     def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent from the registry.
         
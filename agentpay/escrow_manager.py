@@ -10,7 +10,8 @@ Escrows allow agents to lock funds for future payment, with the ability
 to either release to a recipient or cancel and return the funds.
 """
 
-from typing import Dict, Optional, List
+from collections import defaultdict
+from typing import Callable, Dict, Optional, List
 from enum import Enum
 from uuid import uuid4
 from datetime import datetime, UTC
@@ -151,16 +152,30 @@ class EscrowManager:
         ```
     """
     
-    def __init__(self, agent_registry: AgentRegistry, ledger_manager: LedgerManager):
+    def __init__(self, agent_registry: AgentRegistry, ledger_manager: LedgerManager,
+                 id_factory: Optional[Callable[[], str]] = None):
         """Initialize the escrow manager.
         
         Args:
             agent_registry (AgentRegistry): Registry for accessing agents
             ledger_manager (LedgerManager): Ledger for recording transactions
+            id_factory (Optional[Callable[[], str]]): Generates escrow IDs
+                (e.g. a counter in tests). Defaults to random UUIDs.
         """
         self.agent_registry = agent_registry
         self.ledger_manager = ledger_manager
+        self._id_factory = id_factory
         self._escrows: Dict[str, Escrow] = {}
+        # Indexes over _escrows, so list queries don't scan every escrow
+        self._escrows_by_payer: Dict[str, List[Escrow]] = defaultdict(list)
+        self._escrows_by_recipient: Dict[str, List[Escrow]] = defaultdict(list)
+        self._escrows_by_status: Dict[EscrowStatus, Dict[str, Escrow]] = defaultdict(dict)
+    
+    def _new_escrow(self, **fields) -> Escrow:
+        """Build an Escrow, taking its ID from id_factory if one was given."""
+        if self._id_factory is not None:
+            fields["escrow_id"] = self._id_factory()
+        return Escrow(**fields)
     
     def create_escrow(self, from_agent_id: str, to_agent_id: str, amount: int,
                      memo: Optional[str] = None) -> EscrowResult:
@@ -199,7 +214,7 @@ class EscrowManager:
         to_agent = self.agent_registry.get_agent(to_agent_id)
         
         if from_agent is None:
-            escrow = Escrow(from_agent_id=from_agent_id, to_agent_id=to_agent_id, amount=amount)
+            escrow = self._new_escrow(from_agent_id=from_agent_id, to_agent_id=to_agent_id, amount=amount)
             return EscrowResult(
                 success=False,
                 escrow=escrow,
@@ -208,7 +223,7 @@ class EscrowManager:
             )
         
         if to_agent is None:
-            escrow = Escrow(from_agent_id=from_agent_id, to_agent_id=to_agent_id, amount=amount)
+            escrow = self._new_escrow(from_agent_id=from_agent_id, to_agent_id=to_agent_id, amount=amount)
             return EscrowResult(
                 success=False,
                 escrow=escrow,
@@ -218,7 +233,7 @@ class EscrowManager:
         
         # Check sufficient balance
         if not from_agent.wallet.can_hold(amount):
-            escrow = Escrow(from_agent_id=from_agent_id, to_agent_id=to_agent_id, amount=amount)
+            escrow = self._new_escrow(from_agent_id=from_agent_id, to_agent_id=to_agent_id, amount=amount)
             return EscrowResult(
                 success=False,
                 escrow=escrow,
@@ -227,7 +242,7 @@ class EscrowManager:
             )
         
         # Create escrow object
-        escrow = Escrow(
+        escrow = self._new_escrow(
             from_agent_id=from_agent_id,
             to_agent_id=to_agent_id,
             amount=amount,
@@ -245,6 +260,9 @@ class EscrowManager:
             
             # Store escrow
             self._escrows[escrow.escrow_id] = escrow
+            self._escrows_by_payer[escrow.from_agent_id].append(escrow)
+            self._escrows_by_recipient[escrow.to_agent_id].append(escrow)
+            self._escrows_by_status[escrow.status][escrow.escrow_id] = escrow
             
             return EscrowResult(success=True, escrow=escrow)
             
@@ -311,6 +329,7 @@ class EscrowManager:
             
             # Mark as released
             escrow.mark_released()
+            self._reindex_status(escrow, EscrowStatus.LOCKED)
             
             return EscrowResult(success=True, escrow=escrow)
             
@@ -376,6 +395,7 @@ class EscrowManager:
             
             # Mark as cancelled
             escrow.mark_cancelled()
+            self._reindex_status(escrow, EscrowStatus.LOCKED)
             
             return EscrowResult(success=True, escrow=escrow)
             
@@ -387,6 +407,11 @@ class EscrowManager:
                 error_message=f"Escrow cancellation failed: {str(e)}"
             )
     
+    def _reindex_status(self, escrow: Escrow, previous: EscrowStatus) -> None:
+        """Move an escrow from its previous status index to its current one."""
+        self._escrows_by_status[previous].pop(escrow.escrow_id, None)
+        self._escrows_by_status[escrow.status][escrow.escrow_id] = escrow
+    
     def get_escrow(self, escrow_id: str) -> Optional[Escrow]:
         """Get an escrow by ID.
         
@@ -407,7 +432,7 @@ class EscrowManager:
         Returns:
             List[Escrow]: All escrows from this agent
         """
-        return [e for e in self._escrows.values() if e.from_agent_id == agent_id]
+        return list(self._escrows_by_payer.get(agent_id, ()))
     
     def list_escrows_by_recipient(self, agent_id: str) -> List[Escrow]:
         """Get all escrows where agent is the recipient.
@@ -418,7 +443,7 @@ class EscrowManager:
         Returns:
             List[Escrow]: All escrows to this agent
         """
-        return [e for e in self._escrows.values() if e.to_agent_id == agent_id]
+        return list(self._escrows_by_recipient.get(agent_id, ()))
     
     def list_escrows_by_status(self, status: EscrowStatus) -> List[Escrow]:
         """Get all escrows with a specific status.
@@ -429,7 +454,7 @@ class EscrowManager:
         Returns:
             List[Escrow]: All escrows with this status
         """
-        return [e for e in self._escrows.values() if e.status == status]
+        return list(self._escrows_by_status.get(status, {}).values())
     
     def get_all_escrows(self) -> List[Escrow]:
         """Get all escrows in the system.
@@ -446,3 +471,6 @@ class EscrowManager:
             This is for testing only. Does NOT affect ledger or wallets.
         """
         self._escrows.clear()
+        self._escrows_by_payer.clear()
+        self._escrows_by_recipient.clear()
+        self._escrows_by_status.clear()
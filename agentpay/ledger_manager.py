@@ -11,6 +11,8 @@ Key Principle: Every transaction creates entries such that the sum of all
 delta_amounts equals zero (value is conserved).
 """
 
+from collections import defaultdict
+from operator import attrgetter
 from typing import List, Dict, Optional
 from agentpay.models import LedgerEntry, EntryType, TransactionType, Agent
 from agentpay.agent_registry import AgentRegistry
@@ -73,10 +75,23 @@ class LedgerManager:
         """Initialize the ledger manager.
         
         Args:
-            agent_registry (AgentRegistry): The agent registry for wallet updates
+            agent_registry (AgentRegistry): The agent registry for wallet updates.
+                get_agent returns the live agents, so wallets are updated in
+                place with no write back to the registry.
         """
         self.agent_registry = agent_registry
         self._entries: List[LedgerEntry] = []
+        # Indexes over _entries, so per-agent and per-transaction queries
+        # don't scan the whole ledger
+        self._entries_by_agent: Dict[str, List[LedgerEntry]] = defaultdict(list)
+        self._entries_by_reference: Dict[str, List[LedgerEntry]] = defaultdict(list)
+    
+    def _append_entries(self, *entries: LedgerEntry) -> None:
+        """Append entries to the ledger and its agent/reference indexes."""
+        for entry in entries:
+            self._entries.append(entry)
+            self._entries_by_agent[entry.agent_id].append(entry)
+            self._entries_by_reference[entry.reference_id].append(entry)
     
     def record_top_up(self, agent_id: str, amount: int, reference_id: str, 
                      memo: Optional[str] = None) -> LedgerEntry:
@@ -127,8 +142,7 @@ class LedgerManager:
             memo=memo
         )
         
-        self._entries.append(entry)
-        self.agent_registry.update_agent(agent)
+        self._append_entries(entry)
         
         return entry
     
@@ -217,9 +231,7 @@ class LedgerManager:
             counterparty_id=from_agent_id
         )
         
-        self._entries.extend([debit_entry, credit_entry])
-        self.agent_registry.update_agent(from_agent)
-        self.agent_registry.update_agent(to_agent)
+        self._append_entries(debit_entry, credit_entry)
         
         return [debit_entry, credit_entry]
     
@@ -278,8 +290,7 @@ class LedgerManager:
             memo=memo
         )
         
-        self._entries.append(entry)
-        self.agent_registry.update_agent(agent)
+        self._append_entries(entry)
         
         return entry
     
@@ -361,9 +372,7 @@ class LedgerManager:
             counterparty_id=from_agent_id
         )
         
-        self._entries.extend([payer_entry, payee_entry])
-        self.agent_registry.update_agent(from_agent)
-        self.agent_registry.update_agent(to_agent)
+        self._append_entries(payer_entry, payee_entry)
         
         return [payer_entry, payee_entry]
     
@@ -422,8 +431,7 @@ class LedgerManager:
             memo=memo
         )
         
-        self._entries.append(entry)
-        self.agent_registry.update_agent(agent)
+        self._append_entries(entry)
         
         return entry
     
@@ -443,7 +451,7 @@ class LedgerManager:
                 print(f"{entry.entry_type}: {entry.delta_amount}")
             ```
         """
-        return [e for e in self._entries if e.agent_id == agent_id]
+        return list(self._entries_by_agent.get(agent_id, ()))
     
     def get_entries_by_reference(self, reference_id: str) -> List[LedgerEntry]:
         """Get all ledger entries for a specific transaction.
@@ -461,7 +469,7 @@ class LedgerManager:
             # Should have 2 entries (debit + credit)
             ```
         """
-        return [e for e in self._entries if e.reference_id == reference_id]
+        return list(self._entries_by_reference.get(reference_id, ()))
     
     def get_all_entries(self) -> List[LedgerEntry]:
         """Get all ledger entries in the system.
@@ -486,18 +494,53 @@ class LedgerManager:
             assert ledger.verify_double_entry("payment-123") is True
             ```
         """
-        entries = self.get_entries_by_reference(reference_id)
+        # Read the index directly; no need to copy the entries just to sum them
+        entries = self._entries_by_reference.get(reference_id)
         if not entries:
             return True
         
         # Check if this is a TOP_UP or WITHDRAWAL (exceptions to zero-sum rule)
-        entry_types = {e.entry_type for e in entries}
+        entry_types = set(map(attrgetter("entry_type"), entries))
         if EntryType.TOP_UP in entry_types or EntryType.WITHDRAWAL in entry_types:
             return True  # These don't need to sum to zero
         
-        total = sum(e.delta_amount for e in entries)
+        total = sum(map(attrgetter("delta_amount"), entries))
         return total == 0
     
+    def verify_all_double_entries(self) -> bool:
+        """Verify that every transaction in the ledger balances.
+        
+        Walks the reference index once, so checking the whole ledger visits
+        each entry a single time instead of rescanning it per transaction.
+        
+        Non-escrow transactions follow the verify_double_entry rules. An
+        escrow's ESCROW_LOCK entry only moves the payer's funds from balance
+        to hold, so an escrow balances when its remaining entries sum to zero
+        (still locked, or released to the payee) or when everything sums to
+        zero (cancelled back to the payer).
+        
+        Returns:
+            bool: True if every transaction balances
+            
+        Example:
+            ```python
+            assert ledger.verify_all_double_entries() is True
+            ```
+        """
+        for reference_id, entries in self._entries_by_reference.items():
+            if self.verify_double_entry(reference_id):
+                continue
+            
+            settled = sum(
+                entry.delta_amount for entry in entries
+                if entry.entry_type != EntryType.ESCROW_LOCK
+            )
+            if settled != 0 or not any(
+                entry.entry_type == EntryType.ESCROW_LOCK for entry in entries
+            ):
+                return False
+        return True
+    
     def get_entry_count(self) -> int:
         """Get total number of ledger entries.
         
@@ -513,3 +556,5 @@ class LedgerManager:
             This is destructive and only for testing. Does NOT reset agent wallets.
         """
         self._entries.clear()
+        self._entries_by_agent.clear()
+        self._entries_by_reference.clear()
@@ -146,7 +146,7 @@ class PaymentEngine:
         # Check idempotency
         if payment_intent.idempotency_key:
             existing = self._processed_intents.get(payment_intent.idempotency_key)
-            if existing:
+            if existing is not None:
                 return PaymentResult(
                     success=existing.status == PaymentStatus.COMPLETED,
                     payment_intent=existing,
@@ -279,6 +279,18 @@ class PaymentEngine:
         # Look up by intent_id
         return self._all_intents.get(intent_id)
     
+    def find_by_idempotency_key(self, idempotency_key: str) -> Optional[PaymentIntent]:
+        """Get the intent recorded for an idempotency key.
+        
+        Args:
+            idempotency_key (str): The key passed when the payment was made
+            
+        Returns:
+            Optional[PaymentIntent]: The intent a retry with this key would
+            return, or None if the key hasn't been used
+        """
+        return self._processed_intents.get(idempotency_key)
+    
     def clear_idempotency_cache(self) -> None:
         """Clear the idempotency cache.
         
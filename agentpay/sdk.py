@@ -4,7 +4,7 @@ This module provides the main SDK interface that wraps all internal components
 into a simple, easy-to-use API for agent payment operations.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import uuid4
 
 from agentpay.models import Agent, Wallet, Policy, PaymentIntent, PaymentStatus, LedgerEntry
@@ -183,6 +183,43 @@ class AgentPaySDK:
         )
         return self.registry.register_agent(agent)
     
+    def register_agents(self, agents: List[Dict[str, Any]]) -> List[Agent]:
+        """Register several agents in a single call.
+        
+        Either all agents are registered or, if any ID is taken, none are.
+        
+        Args:
+            agents (List[Dict]): One dict per agent with the keyword arguments
+                of register_agent() (agent_id, and optional policy and metadata)
+            
+        Returns:
+            List[Agent]: The registered agents, in the order given
+            
+        Raises:
+            ValueError: If any agent_id already exists or appears twice
+            
+        Example:
+            ```python
+            alice, bob = sdk.register_agents([
+                {"agent_id": "alice", "metadata": {"name": "Alice"}},
+                {"agent_id": "bob", "policy": Policy(max_per_transaction=5000)},
+            ])
+            ```
+        """
+        if self.mode == 'remote':
+            raise NotImplementedError(
+                "register_agents() is only available in local mode currently"
+            )
+        
+        return self.registry.register_agents([
+            Agent(
+                agent_id=agent["agent_id"],
+                policy=agent.get("policy") or Policy(),
+                metadata=agent.get("metadata") or {}
+            )
+            for agent in agents
+        ])
+    
     def get_agent(self, agent_id: str) -> Optional[Agent]:
         """Get an agent by ID.
         
@@ -449,6 +486,31 @@ class AgentPaySDK:
         """
         return self.payment_engine.get_payment_status(intent_id)
     
+    def find_by_idempotency_key(self, idempotency_key: str) -> Optional[PaymentIntent]:
+        """Get the payment intent recorded for an idempotency key.
+        
+        Args:
+            idempotency_key (str): The key passed to pay()
+            
+        Returns:
+            Optional[PaymentIntent]: The intent a retry with this key would
+            return, or None if the key hasn't been used
+            
+        Example:
+            ```python
+            sdk.pay("alice", "bob", 1000, idempotency_key="order-42")
+            
+            intent = sdk.find_by_idempotency_key("order-42")
+            print(f"Status: {intent.status}")
+            ```
+        """
+        if self.mode == 'remote':
+            raise NotImplementedError(
+                "find_by_idempotency_key() is only available in local mode currently"
+            )
+        
+        return self.payment_engine.find_by_idempotency_key(idempotency_key)
+    
     # ========== Escrow Operations ==========
     
     def create_escrow(
@@ -908,8 +970,75 @@ class AgentPaySDK:
         if not agent:
             raise ValueError(f"Agent {agent_id} not found")
         
+        return self._balance_summary(agent)
+    
+    def get_agent_full(self, agent_id: str) -> Tuple[Agent, Dict[str, Any]]:
+        """Get an agent together with its balance summary in one call.
+        
+        Args:
+            agent_id: Agent ID to query
+        
+        Returns:
+            Tuple of (Agent, summary dict as returned by get_agent_balance_summary())
+        
+        Raises:
+            ValueError: If agent doesn't exist
+        
+        Example:
+            ```python
+            agent, summary = sdk.get_agent_full("agent-b")
+            print(f"{agent.display_name}: ${summary['net_profit'] / 100}")
+            ```
+        """
+        if self.mode == 'remote':
+            raise NotImplementedError(
+                "get_agent_full() is only available in local mode currently"
+            )
+        
+        agent = self.get_agent(agent_id)
+        if not agent:
+            raise ValueError(f"Agent {agent_id} not found")
+        
+        return agent, self._balance_summary(agent)
+    
+    def get_balance_summaries(self, agent_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get balance summaries for several agents in one call.
+        
+        Args:
+            agent_ids: Agent IDs to query
+        
+        Returns:
+            Dict mapping each agent ID to the same summary dict returned by
+            get_agent_balance_summary()
+        
+        Raises:
+            ValueError: If any of the agents doesn't exist
+        
+        Example:
+            ```python
+            summaries = sdk.get_balance_summaries(["agent-a", "agent-b"])
+            for agent_id, summary in summaries.items():
+                print(f"{agent_id}: ${summary['net_profit'] / 100}")
+            ```
+        """
+        if self.mode == 'remote':
+            raise NotImplementedError(
+                "get_balance_summaries() is only available in local mode currently"
+            )
+        
+        summaries = {}
+        for agent_id in agent_ids:
+            agent = self.get_agent(agent_id)
+            if not agent:
+                raise ValueError(f"Agent {agent_id} not found")
+            summaries[agent_id] = self._balance_summary(agent)
+        
+        return summaries
+    
+    def _balance_summary(self, agent: Agent) -> Dict[str, Any]:
+        """Build the balance summary dict for an agent."""
         return {
-            'agent_id': agent_id,
+            'agent_id': agent.agent_id,
             'current_balance': agent.wallet.balance,
             'total_earned': agent.total_earned,
             'total_spent': agent.total_spent,
@@ -5,14 +5,19 @@ whether they are orchestrators, specialized service providers, or general agents
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from uuid import uuid4
 from datetime import datetime, UTC
 from pydantic import BaseModel, Field
 
 from agentpay import AgentPaySDK
-from agents.base.capabilities import CapabilityProfile, AgentCapability
+from agents.base.capabilities import (
+    AgentCapability,
+    CapabilityLevel,
+    CapabilityMatcher,
+    CapabilityProfile,
+)
 
 
 class TaskStatus(str, Enum):
@@ -123,7 +128,7 @@ class BaseAgent(ABC):
         agent_id: Unique identifier for this agent
         name: Human-readable name
         sdk: AgentPaySDK instance for payments
-        capabilities: List of capabilities this agent has
+        capabilities: Capabilities this agent has (read-only; see add_capability)
         is_active: Whether agent is currently accepting tasks
         reputation_score: Agent's reputation (0-100)
     
@@ -167,7 +172,10 @@ class BaseAgent(ABC):
         self.agent_id = agent_id
         self.name = name
         self.description = description
-        self.capabilities: List[CapabilityProfile] = []
+        # Only add_capability() may change these two, so they stay in sync
+        self._capabilities: List[CapabilityProfile] = []
+        # Capabilities grouped by type, highest level first (for fast lookups)
+        self._capability_index: Dict[AgentCapability, List[CapabilityProfile]] = {}
         self.is_active = True
         self.reputation_score = 50.0  # Start at neutral
         self.tasks_completed = 0
@@ -184,6 +192,15 @@ class BaseAgent(ABC):
                 }
             )
     
+    @property
+    def capabilities(self) -> Tuple[CapabilityProfile, ...]:
+        """This agent's capabilities, in the order they were added.
+        
+        Read-only: use add_capability() so the lookup index stays in sync
+        with the list.
+        """
+        return tuple(self._capabilities)
+    
     def add_capability(
         self,
         capability: AgentCapability,
@@ -211,7 +228,8 @@ class BaseAgent(ABC):
             level=level,
             specializations=specializations or []
         )
-        self.capabilities.append(profile)
+        self._capabilities.append(profile)
+        CapabilityMatcher.add_to_index(self._capability_index, profile)
     
     def has_capability(
         self,
@@ -227,10 +245,9 @@ class BaseAgent(ABC):
         Returns:
             True if agent has the capability at required level
         """
-        for cap_profile in self.capabilities:
-            if cap_profile.matches(capability, min_level):
-                return True
-        return False
+        return CapabilityMatcher.find_best_match_in_index(
+            self._capability_index, capability, min_level
+        ) is not None
     
     @abstractmethod
     def execute_task(self, task: Task) -> TaskResult:
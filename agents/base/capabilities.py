@@ -4,9 +4,11 @@ This module defines the types of capabilities agents can have
 and the system for matching agents to tasks.
 """
 
+import sys
+from bisect import insort
 from enum import Enum
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AgentCapability(str, Enum):
@@ -75,12 +77,50 @@ class CapabilityLevel(str, Enum):
     EXPERT = "expert"          # Master level, premium service
 
 
+# Capabilities that often go together
+_RELATED_CAPABILITIES: Dict[AgentCapability, Tuple[AgentCapability, ...]] = {
+    AgentCapability.DATA_ANALYSIS: (
+        AgentCapability.DATA_CLEANING,
+        AgentCapability.DATA_VISUALIZATION,
+        AgentCapability.STATISTICAL_ANALYSIS
+    ),
+    AgentCapability.CONTENT_WRITING: (
+        AgentCapability.COPYWRITING,
+        AgentCapability.BLOG_WRITING,
+        AgentCapability.EMAIL_WRITING
+    ),
+    AgentCapability.CODE_REVIEW: (
+        AgentCapability.TESTING,
+        AgentCapability.BUG_FIXING,
+        AgentCapability.DOCUMENTATION
+    ),
+    AgentCapability.MARKET_RESEARCH: (
+        AgentCapability.COMPETITIVE_ANALYSIS,
+        AgentCapability.DATA_ANALYSIS,
+        AgentCapability.WEB_SCRAPING
+    ),
+}
+
+# Numeric rank for each level, shared by all matching code
+_LEVEL_RANK: Dict[CapabilityLevel, int] = {
+    CapabilityLevel.BEGINNER: 1,
+    CapabilityLevel.INTERMEDIATE: 2,
+    CapabilityLevel.ADVANCED: 3,
+    CapabilityLevel.EXPERT: 4
+}
+
+
 class CapabilityProfile(BaseModel):
     """Profile describing an agent's capabilities.
     
     Used to advertise what an agent can do and at what level.
     Enables capability-based agent discovery and matching.
+    
+    Profiles are immutable once created, so they can be shared between an
+    agent's capability list and its lookup index without copying.
     """
+    model_config = ConfigDict(frozen=True)
+    
     capability: AgentCapability = Field(
         description="The type of capability"
     )
@@ -96,6 +136,20 @@ class CapabilityProfile(BaseModel):
         description="Specific areas of expertise within this capability"
     )
     
+    @field_validator("specializations", mode="before")
+    @classmethod
+    def _intern_specializations(cls, value):
+        """Intern specialization strings.
+        
+        The same few specializations (e.g. "time series") repeat across many
+        agents, so interning lets every profile share one string object.
+        Capability and level values need no such step: they parse to the
+        enum singletons.
+        """
+        if isinstance(value, (list, tuple)):
+            return [sys.intern(v) if isinstance(v, str) else v for v in value]
+        return value
+    
     def matches(self, required_capability: AgentCapability, min_level: Optional[CapabilityLevel] = None) -> bool:
         """Check if this capability matches requirements.
         
@@ -138,14 +192,7 @@ class CapabilityProfile(BaseModel):
             return True
         
         # Check if agent's level meets minimum requirement
-        level_hierarchy = {
-            CapabilityLevel.BEGINNER: 1,
-            CapabilityLevel.INTERMEDIATE: 2,
-            CapabilityLevel.ADVANCED: 3,
-            CapabilityLevel.EXPERT: 4
-        }
-        
-        return level_hierarchy[self.level] >= level_hierarchy[min_level]
+        return _LEVEL_RANK[self.level] >= _LEVEL_RANK[min_level]
 
 
 class CapabilityMatcher:
@@ -176,23 +223,83 @@ class CapabilityMatcher:
         Returns:
             Best matching CapabilityProfile or None if no match
         """
-        matches = [
-            cap for cap in agent_capabilities
-            if cap.matches(required_capability, min_level)
-        ]
+        # Single pass: track the highest-level match seen so far
+        min_rank = _LEVEL_RANK[min_level] if min_level is not None else 0
+        best: Optional[CapabilityProfile] = None
+        best_rank = 0
         
-        if not matches:
-            return None
+        for cap in agent_capabilities:
+            if cap.capability != required_capability:
+                continue
+            rank = _LEVEL_RANK[cap.level]
+            if rank >= min_rank and rank > best_rank:
+                best, best_rank = cap, rank
         
-        # Return highest level match
-        level_hierarchy = {
-            CapabilityLevel.BEGINNER: 1,
-            CapabilityLevel.INTERMEDIATE: 2,
-            CapabilityLevel.ADVANCED: 3,
-            CapabilityLevel.EXPERT: 4
-        }
+        return best
+    
+    @staticmethod
+    def build_index(
+        agent_capabilities: List[CapabilityProfile]
+    ) -> Dict[AgentCapability, List[CapabilityProfile]]:
+        """Group an agent's capabilities by type, highest level first.
+        
+        The index lets repeated lookups skip scanning the full profile list.
+        
+        Args:
+            agent_capabilities: List of agent's capabilities
+        
+        Returns:
+            Dict mapping each capability to its profiles sorted by level (descending)
+        """
+        index: Dict[AgentCapability, List[CapabilityProfile]] = {}
+        for profile in agent_capabilities:
+            CapabilityMatcher.add_to_index(index, profile)
+        return index
+    
+    @staticmethod
+    def add_to_index(
+        index: Dict[AgentCapability, List[CapabilityProfile]],
+        profile: CapabilityProfile
+    ) -> None:
+        """Insert a profile into an index built by `build_index`.
         
-        return max(matches, key=lambda c: level_hierarchy[c.level])
+        Keeps each bucket sorted by level (descending). Profiles with equal
+        levels stay in insertion order.
+        
+        Args:
+            index: Capability index to update in place
+            profile: Profile to insert
+        """
+        bucket = index.setdefault(profile.capability, [])
+        insort(bucket, profile, key=lambda p: -_LEVEL_RANK[p.level])
+    
+    @staticmethod
+    def find_best_match_in_index(
+        index: Dict[AgentCapability, List[CapabilityProfile]],
+        required_capability: AgentCapability,
+        min_level: Optional[CapabilityLevel] = None
+    ) -> Optional[CapabilityProfile]:
+        """Find the best matching capability using a prebuilt index.
+        
+        Equivalent to `find_best_match`, but only the highest-level profile
+        for the required capability needs to be checked.
+        
+        Args:
+            index: Capability index from `build_index`
+            required_capability: Required capability type
+            min_level: Minimum level required
+        
+        Returns:
+            Best matching CapabilityProfile or None if no match
+        """
+        bucket = index.get(required_capability)
+        if not bucket:
+            return None
+        
+        best = bucket[0]
+        if min_level is not None and _LEVEL_RANK[best.level] < _LEVEL_RANK[min_level]:
+            return None
+        return best
     
     @staticmethod
     def get_capability_category(capability: AgentCapability) -> str:
@@ -266,27 +373,4 @@ class CapabilityMatcher:
         Returns:
             List of related capabilities
         """
-        relations = {
-            AgentCapability.DATA_ANALYSIS: [
-                AgentCapability.DATA_CLEANING,
-                AgentCapability.DATA_VISUALIZATION,
-                AgentCapability.STATISTICAL_ANALYSIS
-            ],
-            AgentCapability.CONTENT_WRITING: [
-                AgentCapability.COPYWRITING,
-                AgentCapability.BLOG_WRITING,
-                AgentCapability.EMAIL_WRITING
-            ],
-            AgentCapability.CODE_REVIEW: [
-                AgentCapability.TESTING,
-                AgentCapability.BUG_FIXING,
-                AgentCapability.DOCUMENTATION
-            ],
-            AgentCapability.MARKET_RESEARCH: [
-                AgentCapability.COMPETITIVE_ANALYSIS,
-                AgentCapability.DATA_ANALYSIS,
-                AgentCapability.WEB_SCRAPING
-            ],
-        }
-        
-        return relations.get(capability, [])
+        return list(_RELATED_CAPABILITIES.get(capability, ()))
@@ -0,0 +1,66 @@
+"""
+Console buffering shared by the autonomous agent examples.
+
+Lets independent scenarios run concurrently in worker threads while each
+one's printed report is captured, so the caller can write the reports out
+as whole blocks, in scenario order, instead of interleaved line by line.
+"""
+import asyncio
+import contextlib
+import io
+import sys
+import threading
+from typing import Any, Callable, Iterable, List, Tuple
+
+# Per-thread output buffer used while scenarios run concurrently
+_thread_output = threading.local()
+
+
+class PerThreadStdout:
+    """
+    Stdout proxy that sends writes from buffered worker threads to their own buffer.
+    
+    Threads without a buffer (e.g. the main thread) write straight through,
+    so concurrent scenarios can print freely without shredding each other's output.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(_thread_output, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+def run_buffered(func: Callable, *args) -> Tuple[Any, str]:
+    """
+    Run func in the current thread, capturing everything it prints.
+    
+    Returns:
+        Tuple of (func's return value, captured output)
+    """
+    _thread_output.buffer = io.StringIO()
+    try:
+        return func(*args), _thread_output.buffer.getvalue()
+    finally:
+        _thread_output.buffer = None
+
+
+async def run_all_buffered(func: Callable, args: Iterable) -> List[Tuple[Any, str]]:
+    """
+    Run func(arg) for every arg at once, each in a worker thread with its output captured.
+    
+    Args:
+        func: Synchronous function to run (e.g. an agent's run_scenario)
+        args: One argument per call
+    
+    Returns:
+        One (return value, captured output) pair per arg, in the same order
+    """
+    with contextlib.redirect_stdout(PerThreadStdout(sys.stdout)):
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(run_buffered, func, arg) for arg in args)
+        ))
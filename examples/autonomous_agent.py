@@ -5,9 +5,12 @@ get approval via quorum consensus, and make purchases.
 
 Also demonstrates agent-to-agent service payments and earnings tracking.
 """
+import asyncio
+import logging
 import os
 import sys
 import time
+import types
 from typing import Dict, Optional
 
 # Add parent directory to path to import agentpay
@@ -22,38 +25,75 @@ except ImportError:
     env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
     if os.path.exists(env_path):
         with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
+            lines = [line.strip() for line in f.read().splitlines()]
+        os.environ.update(
+            (key.strip(), value.strip())
+            for key, value in (
+                line.split('=', 1) for line in lines
+                if line and not line.startswith('#') and '=' in line
+            )
+        )
 
 from agentpay import AgentPaySDK
+from _console_buffer import run_all_buffered
 
-import os
-import sys
-import time
-from typing import Dict, Optional
+logger = logging.getLogger(__name__)
 
-# Add parent directory to path to import agentpay
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Section separators used by the console output
+_SEP_EQ = "=" * 60
+_SEP_HASH = "#" * 60
 
-# Try to load .env file if available
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # python-dotenv not installed, try to manually load .env
-    env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
-    if os.path.exists(env_path):
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+# One row of the final summary, filled in with str.format_map
+_ROW_TMPL = (
+    "{i}. {scenario_upper}: {status}\n"
+    "   Approved: {approved}, Purchased: {purchased}\n"
+    "   Duration: {duration:.2f}s\n"
+    "\n"
+)
 
-from agentpay import AgentPaySDK
+# Payment request parameters for each business scenario (read-only, built once at import)
+_SCENARIOS = types.MappingProxyType({
+    "ad_campaign": {
+        "amount": 10000,  # $100
+        "purpose": "OpenAI API Credits",
+        "justification": (
+            "Need GPT-4 to generate high-quality ad copy for Q4 marketing campaign. "
+            "Current manual copywriting costs $500/week. AI-generated copy has shown "
+            "30% higher engagement in A/B tests."
+        ),
+        "expected_roi": (
+            "Expected $5,000 in additional revenue from improved ad performance. "
+            "Will save 10 hours/week of copywriter time ($250 value)."
+        ),
+        "urgency": "High",
+        "budget_remaining": 50000
+    },
+    "analytics": {
+        "amount": 5000,  # $50
+        "purpose": "Data Analysis Tools Subscription",
+        "justification": (
+            "Need advanced analytics platform to track campaign performance metrics. "
+            "Current manual Excel tracking is error-prone and time-consuming."
+        ),
+        "expected_roi": (
+            "Improved decision-making through real-time data insights. "
+            "Save 5 hours/week of manual data processing."
+        ),
+        "urgency": "Medium",
+        "budget_remaining": 50000
+    },
+    "infrastructure": {
+        "amount": 250000,  # $2,500
+        "purpose": "AWS Cloud Services",
+        "justification": (
+            "Want to experiment with new cloud infrastructure setup. "
+            "Not urgent, no clear immediate benefit."
+        ),
+        "expected_roi": "Unclear - exploratory expense",
+        "urgency": "Low",
+        "budget_remaining": 50000
+    }
+})
 
 
 class AutonomousMarketingAgent:
@@ -80,12 +120,12 @@ class AutonomousMarketingAgent:
         self.agent_id = agent_id
         self.name = "Marketing Agent"
         
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP_EQ}")
         print(f"🤖 {self.name} Initialized")
-        print(f"{'='*60}")
+        print(_SEP_EQ)
         print(f"Agent ID: {agent_id}")
         print(f"SDK Mode: {self.sdk.mode}")
-        print(f"{'='*60}\n")
+        print(f"{_SEP_EQ}\n")
     
     def analyze_and_request_payment(
         self,
@@ -104,63 +144,18 @@ class AutonomousMarketingAgent:
             Payment request result with approval status and card details
         """
         
-        # Define scenarios with different characteristics
-        scenarios = {
-            "ad_campaign": {
-                "amount": 10000,  # $100
-                "purpose": "OpenAI API Credits",
-                "justification": (
-                    "Need GPT-4 to generate high-quality ad copy for Q4 marketing campaign. "
-                    "Current manual copywriting costs $500/week. AI-generated copy has shown "
-                    "30% higher engagement in A/B tests."
-                ),
-                "expected_roi": (
-                    "Expected $5,000 in additional revenue from improved ad performance. "
-                    "Will save 10 hours/week of copywriter time ($250 value)."
-                ),
-                "urgency": "High",
-                "budget_remaining": 50000
-            },
-            "analytics": {
-                "amount": 5000,  # $50
-                "purpose": "Data Analysis Tools Subscription",
-                "justification": (
-                    "Need advanced analytics platform to track campaign performance metrics. "
-                    "Current manual Excel tracking is error-prone and time-consuming."
-                ),
-                "expected_roi": (
-                    "Improved decision-making through real-time data insights. "
-                    "Save 5 hours/week of manual data processing."
-                ),
-                "urgency": "Medium",
-                "budget_remaining": 50000
-            },
-            "infrastructure": {
-                "amount": 250000,  # $2,500
-                "purpose": "AWS Cloud Services",
-                "justification": (
-                    "Want to experiment with new cloud infrastructure setup. "
-                    "Not urgent, no clear immediate benefit."
-                ),
-                "expected_roi": "Unclear - exploratory expense",
-                "urgency": "Low",
-                "budget_remaining": 50000
-            }
-        }
-        
-        if scenario not in scenarios:
+        config = _SCENARIOS.get(scenario)
+        if config is None:
             print(f"❌ Unknown scenario: {scenario}")
             return None
         
-        config = scenarios[scenario]
-        
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP_EQ}")
         print(f"📊 SCENARIO: {scenario.upper().replace('_', ' ')}")
-        print(f"{'='*60}")
+        print(_SEP_EQ)
         print(f"Amount Requested: ${config['amount'] / 100:.2f}")
         print(f"Purpose: {config['purpose']}")
         print(f"Urgency: {config['urgency']}")
-        print(f"{'='*60}\n")
+        print(f"{_SEP_EQ}\n")
         
         print("🤖 Agent Decision: Proceeding with payment request...")
         print("📤 Submitting to quorum for approval...\n")
@@ -178,9 +173,9 @@ class AutonomousMarketingAgent:
                 budget_remaining=config['budget_remaining']
             )
             
-            print(f"\n{'='*60}")
+            print(f"\n{_SEP_EQ}")
             print("📋 QUORUM CONSENSUS RESULT")
-            print(f"{'='*60}")
+            print(_SEP_EQ)
             
             if result.get('approved'):
                 print("✅ STATUS: APPROVED")
@@ -213,14 +208,13 @@ class AutonomousMarketingAgent:
                 print(f"   {denial_reason}")
             
             print(f"\nTransaction ID: {result.get('transaction_id', 'N/A')}")
-            print(f"{'='*60}\n")
+            print(f"{_SEP_EQ}\n")
             
             return result
             
         except Exception as e:
             print(f"\n❌ ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Payment request failed for scenario %s", scenario)
             return None
     
     def make_purchase(
@@ -239,12 +233,12 @@ class AutonomousMarketingAgent:
             True if purchase successful, False otherwise
         """
         
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP_EQ}")
         print(f"💳 ATTEMPTING PURCHASE")
-        print(f"{'='*60}")
+        print(_SEP_EQ)
         print(f"Merchant: {merchant}")
         print(f"Amount: ${card.get('amount_limit', 0) / 100:.2f}")
-        print(f"{'='*60}\n")
+        print(f"{_SEP_EQ}\n")
         
         try:
             result = self.sdk.charge_card(
@@ -261,18 +255,17 @@ class AutonomousMarketingAgent:
                 print(f"   Merchant: {result.get('merchant')}")
                 print(f"   Amount: ${result.get('amount', 0) / 100:.2f}")
                 print(f"   Card (last 4): ****{result.get('card_last_4')}")
-                print(f"{'='*60}\n")
+                print(f"{_SEP_EQ}\n")
                 return True
             else:
                 print("❌ PURCHASE FAILED!")
                 print(f"   Error: {result.get('error')}")
-                print(f"{'='*60}\n")
+                print(f"{_SEP_EQ}\n")
                 return False
                 
         except Exception as e:
             print(f"❌ PURCHASE ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Purchase failed at merchant %s", merchant)
             return False
     
     def run_scenario(self, scenario: str) -> Dict:
@@ -286,9 +279,9 @@ class AutonomousMarketingAgent:
             Summary of the workflow execution
         """
         
-        print(f"\n{'#'*60}")
+        print(f"\n{_SEP_HASH}")
         print(f"# AUTONOMOUS AGENT WORKFLOW: {scenario.upper()}")
-        print(f"{'#'*60}\n")
+        print(f"{_SEP_HASH}\n")
         
         start_time = time.time()
         
@@ -326,14 +319,14 @@ class AutonomousMarketingAgent:
             'duration': duration
         }
         
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP_EQ}")
         print("📊 WORKFLOW SUMMARY")
-        print(f"{'='*60}")
+        print(_SEP_EQ)
         print(f"Scenario: {scenario}")
         print(f"Approved: {'✅ Yes' if approved else '❌ No'}")
         print(f"Purchased: {'✅ Yes' if purchased else '❌ No'}")
         print(f"Duration: {duration:.2f}s")
-        print(f"{'='*60}\n")
+        print(f"{_SEP_EQ}\n")
         
         return summary
 
@@ -359,9 +352,9 @@ def main():
     agent = AutonomousMarketingAgent(api_key=api_key)
     
     # Run different scenarios
-    print("\n" + "="*60)
+    print(f"\n{_SEP_EQ}")
     print("🎯 RUNNING 3 AUTONOMOUS AGENT SCENARIOS")
-    print("="*60 + "\n")
+    print(f"{_SEP_EQ}\n")
     
     scenarios = [
         ("ad_campaign", "Should APPROVE - Good ROI, high urgency"),
@@ -369,34 +362,36 @@ def main():
         ("infrastructure", "Should DENY - Vague ROI, low urgency, too expensive")
     ]
     
-    results = []
+    # Scenarios are independent, so wait on the quorum for all of them at once
+    # and then print each one's output as a block, in order
+    outcomes = asyncio.run(
+        run_all_buffered(agent.run_scenario, [scenario for scenario, _ in scenarios])
+    )
     
-    for i, (scenario, description) in enumerate(scenarios, 1):
-        print(f"\n{'#'*60}")
-        print(f"# SCENARIO {i}/3: {description}")
-        print(f"{'#'*60}\n")
-        
-        result = agent.run_scenario(scenario)
+    results = []
+    for i, ((_, description), (result, output)) in enumerate(zip(scenarios, outcomes), 1):
+        print(f"\n{_SEP_HASH}")
+        print(f"# SCENARIO {i}/{len(scenarios)}: {description}")
+        print(f"{_SEP_HASH}\n")
+        sys.stdout.write(output)
         results.append(result)
-        
-        # Wait between scenarios
-        if i < len(scenarios):
-            print("\n⏳ Waiting 5 seconds before next scenario...\n")
-            time.sleep(5)
     
     # Final summary
-    print(f"\n\n{'#'*60}")
+    print(f"\n\n{_SEP_HASH}")
     print("# FINAL SUMMARY - ALL SCENARIOS")
-    print(f"{'#'*60}\n")
+    print(f"{_SEP_HASH}\n")
     
-    for i, result in enumerate(results, 1):
-        status = "✅ SUCCESS" if result['purchased'] else ("⏸️  DENIED" if not result['approved'] else "❌ FAILED")
-        print(f"{i}. {result['scenario'].upper()}: {status}")
-        print(f"   Approved: {result['approved']}, Purchased: {result['purchased']}")
-        print(f"   Duration: {result['duration']:.2f}s")
-        print()
+    sys.stdout.write("".join(
+        _ROW_TMPL.format_map({
+            **result,
+            'i': i,
+            'scenario_upper': result['scenario'].upper(),
+            'status': "✅ SUCCESS" if result['purchased'] else ("⏸️  DENIED" if not result['approved'] else "❌ FAILED"),
+        })
+        for i, result in enumerate(results, 1)
+    ))
     
-    print(f"{'#'*60}\n")
+    print(f"{_SEP_HASH}\n")
 
 
 if __name__ == "__main__":
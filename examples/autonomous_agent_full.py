@@ -5,30 +5,97 @@ Demonstrates:
 2. Agent-to-agent service payments and earnings tracking (local mode)
 3. Complete earning/spending workflow
 """
+import asyncio
 import os
 import sys
 import time
+import types
 from typing import Dict, Optional
 
 # Add parent directory to path to import agentpay
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Try to load .env file if available
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # python-dotenv not installed, try to manually load .env
-    env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
-    if os.path.exists(env_path):
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
-
 from agentpay import AgentPaySDK
+from _console_buffer import run_all_buffered
+
+# Section separators used by the console output
+_SEP_EQ = "=" * 60
+_SEP_HASH = "#" * 60
+_SEP_DASH = "-" * 60
+
+# One income transaction in the earnings report, filled in with str.format_map
+_INCOME_ROW_FMT = "  • ${amount:.2f} from {from_agent}\n    {purpose}\n    {timestamp}\n\n"
+
+# Payment request parameters for each business scenario (read-only, built once at import)
+_SCENARIOS = types.MappingProxyType({
+    "ad_campaign": {
+        "amount": 10000,  # $100
+        "purpose": "OpenAI API Credits",
+        "justification": (
+            "Need GPT-4 to generate high-quality ad copy for Q4 marketing campaign. "
+            "Current manual copywriting costs $500/week. AI-generated copy has shown "
+            "30% higher engagement in A/B tests."
+        ),
+        "expected_roi": (
+            "Expected $5,000 in additional revenue from improved ad performance. "
+            "Will save 10 hours/week of copywriter time ($250 value)."
+        ),
+        "urgency": "High",
+        "budget_remaining": 50000
+    },
+    "analytics": {
+        "amount": 5000,  # $50
+        "purpose": "Data Analysis Tools Subscription",
+        "justification": (
+            "Need advanced analytics platform to track campaign performance metrics. "
+            "Current manual Excel tracking is error-prone and time-consuming."
+        ),
+        "expected_roi": (
+            "Improved decision-making through real-time data insights. "
+            "Save 5 hours/week of manual data processing."
+        ),
+        "urgency": "Medium",
+        "budget_remaining": 50000
+    },
+    "infrastructure": {
+        "amount": 250000,  # $2,500
+        "purpose": "AWS Cloud Services",
+        "justification": (
+            "Want to experiment with new cloud infrastructure setup. "
+            "Not urgent, no clear immediate benefit."
+        ),
+        "expected_roi": "Unclear - exploratory expense",
+        "urgency": "Low",
+        "budget_remaining": 50000
+    }
+})
+
+
+def _load_env() -> None:
+    """
+    Load environment variables from .env (python-dotenv if available, else a minimal parser).
+    
+    Called from main() so importing this module for its agent classes skips it.
+    """
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        # python-dotenv not installed, try to manually load .env
+        env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
+        if os.path.exists(env_path):
+            with open(env_path) as f:
+                data = f.read()
+            os.environ.update(
+                line.split('=', 1)
+                for raw in data.splitlines()
+                if (line := raw.strip()) and not line.startswith('#') and '=' in line
+            )
+
+
+def _emit(*lines: str) -> None:
+    """Write a block of lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 class AutonomousMarketingAgent:
@@ -55,12 +122,14 @@ class AutonomousMarketingAgent:
         self.agent_id = agent_id
         self.name = "Marketing Agent"
         
-        print(f"\n{'='*60}")
-        print(f"🤖 {self.name} Initialized")
-        print(f"{'='*60}")
-        print(f"Agent ID: {agent_id}")
-        print(f"SDK Mode: {self.sdk.mode}")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            f"🤖 {self.name} Initialized",
+            _SEP_EQ,
+            f"Agent ID: {agent_id}",
+            f"SDK Mode: {self.sdk.mode}",
+            f"{_SEP_EQ}\n",
+        )
     
     def analyze_and_request_payment(
         self,
@@ -79,63 +148,20 @@ class AutonomousMarketingAgent:
             Payment request result with approval status and card details
         """
         
-        # Define scenarios with different characteristics
-        scenarios = {
-            "ad_campaign": {
-                "amount": 10000,  # $100
-                "purpose": "OpenAI API Credits",
-                "justification": (
-                    "Need GPT-4 to generate high-quality ad copy for Q4 marketing campaign. "
-                    "Current manual copywriting costs $500/week. AI-generated copy has shown "
-                    "30% higher engagement in A/B tests."
-                ),
-                "expected_roi": (
-                    "Expected $5,000 in additional revenue from improved ad performance. "
-                    "Will save 10 hours/week of copywriter time ($250 value)."
-                ),
-                "urgency": "High",
-                "budget_remaining": 50000
-            },
-            "analytics": {
-                "amount": 5000,  # $50
-                "purpose": "Data Analysis Tools Subscription",
-                "justification": (
-                    "Need advanced analytics platform to track campaign performance metrics. "
-                    "Current manual Excel tracking is error-prone and time-consuming."
-                ),
-                "expected_roi": (
-                    "Improved decision-making through real-time data insights. "
-                    "Save 5 hours/week of manual data processing."
-                ),
-                "urgency": "Medium",
-                "budget_remaining": 50000
-            },
-            "infrastructure": {
-                "amount": 250000,  # $2,500
-                "purpose": "AWS Cloud Services",
-                "justification": (
-                    "Want to experiment with new cloud infrastructure setup. "
-                    "Not urgent, no clear immediate benefit."
-                ),
-                "expected_roi": "Unclear - exploratory expense",
-                "urgency": "Low",
-                "budget_remaining": 50000
-            }
-        }
-        
-        if scenario not in scenarios:
+        config = _SCENARIOS.get(scenario)
+        if config is None:
             print(f"❌ Unknown scenario: {scenario}")
             return None
         
-        config = scenarios[scenario]
-        
-        print(f"\n{'='*60}")
-        print(f"📊 SCENARIO: {scenario.upper().replace('_', ' ')}")
-        print(f"{'='*60}")
-        print(f"Amount Requested: ${config['amount'] / 100:.2f}")
-        print(f"Purpose: {config['purpose']}")
-        print(f"Urgency: {config['urgency']}")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            f"📊 SCENARIO: {scenario.upper().replace('_', ' ')}",
+            _SEP_EQ,
+            f"Amount Requested: ${config['amount'] / 100:.2f}",
+            f"Purpose: {config['purpose']}",
+            f"Urgency: {config['urgency']}",
+            f"{_SEP_EQ}\n",
+        )
         
         print("🤖 Agent Decision: Proceeding with payment request...")
         print("📤 Submitting to quorum for approval...\n")
@@ -183,12 +209,14 @@ class AutonomousMarketingAgent:
             True if purchase successful, False otherwise
         """
         
-        print(f"\n{'='*60}")
-        print(f"💳 ATTEMPTING PURCHASE")
-        print(f"{'='*60}")
-        print(f"Merchant: {merchant}")
-        print(f"Amount: ${card.get('amount_limit', 0) / 100:.2f}")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            f"💳 ATTEMPTING PURCHASE",
+            _SEP_EQ,
+            f"Merchant: {merchant}",
+            f"Amount: ${card.get('amount_limit', 0) / 100:.2f}",
+            f"{_SEP_EQ}\n",
+        )
         
         try:
             result = self.sdk.charge_card(
@@ -222,9 +250,11 @@ class AutonomousMarketingAgent:
             Summary of the workflow execution
         """
         
-        print(f"\n{'#'*60}")
-        print(f"# AUTONOMOUS AGENT WORKFLOW: {scenario.upper()}")
-        print(f"{'#'*60}\n")
+        _emit(
+            f"\n{_SEP_HASH}",
+            f"# AUTONOMOUS AGENT WORKFLOW: {scenario.upper()}",
+            f"{_SEP_HASH}\n",
+        )
         
         start_time = time.time()
         
@@ -259,14 +289,16 @@ class AutonomousMarketingAgent:
             'duration': duration
         }
         
-        print(f"\n{'='*60}")
-        print("📊 WORKFLOW SUMMARY")
-        print(f"{'='*60}")
-        print(f"Scenario: {scenario}")
-        print(f"Approved: {'✅ Yes' if approved else '❌ No'}")
-        print(f"Purchased: {'✅ Yes' if purchased else '❌ No'}")
-        print(f"Duration: {duration:.2f}s")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            "📊 WORKFLOW SUMMARY",
+            _SEP_EQ,
+            f"Scenario: {scenario}",
+            f"Approved: {'✅ Yes' if approved else '❌ No'}",
+            f"Purchased: {'✅ Yes' if purchased else '❌ No'}",
+            f"Duration: {duration:.2f}s",
+            f"{_SEP_EQ}\n",
+        )
         
         return summary
 
@@ -296,14 +328,16 @@ class AutonomousServiceAgent:
         self.name = f"{service_type} Service Agent"
         self.service_type = service_type
         
-        print(f"\n{'='*60}")
-        print(f"💼 {self.name} Initialized")
-        print(f"{'='*60}")
-        print(f"Agent ID: {agent_id}")
-        print(f"Service: {service_type}")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            f"💼 {self.name} Initialized",
+            _SEP_EQ,
+            f"Agent ID: {agent_id}",
+            f"Service: {service_type}",
+            f"{_SEP_EQ}\n",
+        )
     
-    def provide_service_and_get_paid(
+    async def provide_service_and_get_paid(
         self,
         client_agent_id: str,
         service_description: str,
@@ -321,17 +355,19 @@ class AutonomousServiceAgent:
             Payment receipt with status
         """
         
-        print(f"\n{'='*60}")
-        print(f"💼 PROVIDING SERVICE")
-        print(f"{'='*60}")
-        print(f"Service: {service_description}")
-        print(f"Client: {client_agent_id}")
-        print(f"Price: ${price / 100:.2f}")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            f"💼 PROVIDING SERVICE",
+            _SEP_EQ,
+            f"Service: {service_description}",
+            f"Client: {client_agent_id}",
+            f"Price: ${price / 100:.2f}",
+            f"{_SEP_EQ}\n",
+        )
         
-        # Simulate service delivery
+        # Simulate service delivery without blocking other agents on the loop
         print("🔧 Performing service...")
-        time.sleep(1)
+        await asyncio.sleep(1)
         print("✅ Service completed!\n")
         
         # Request payment from client agent
@@ -344,20 +380,24 @@ class AutonomousServiceAgent:
             )
             
             if result.get('status') == 'completed':
-                print(f"💰 PAYMENT RECEIVED!")
-                print(f"   Transaction ID: {result['transaction_id']}")
-                print(f"   Amount: ${result['amount'] / 100:.2f}")
-                print(f"   From: {result['from_agent']}")
-                print(f"{'='*60}\n")
+                _emit(
+                    f"💰 PAYMENT RECEIVED!",
+                    f"   Transaction ID: {result['transaction_id']}",
+                    f"   Amount: ${result['amount'] / 100:.2f}",
+                    f"   From: {result['from_agent']}",
+                    f"{_SEP_EQ}\n",
+                )
                 
                 # Check updated balance
                 summary = self.sdk.get_agent_balance_summary(self.agent_id)
-                print(f"📊 UPDATED BALANCE")
-                print(f"   Current: ${summary['current_balance'] / 100:.2f}")
-                print(f"   Total Earned: ${summary['total_earned'] / 100:.2f}")
-                print(f"   Total Spent: ${summary['total_spent'] / 100:.2f}")
-                print(f"   Net Profit: ${summary['net_profit'] / 100:.2f}")
-                print(f"{'='*60}\n")
+                _emit(
+                    f"📊 UPDATED BALANCE",
+                    f"   Current: ${summary['current_balance'] / 100:.2f}",
+                    f"   Total Earned: ${summary['total_earned'] / 100:.2f}",
+                    f"   Total Spent: ${summary['total_spent'] / 100:.2f}",
+                    f"   Net Profit: ${summary['net_profit'] / 100:.2f}",
+                    f"{_SEP_EQ}\n",
+                )
                 
                 return result
             else:
@@ -370,9 +410,11 @@ class AutonomousServiceAgent:
     def view_earnings_report(self):
         """Display a detailed earnings report for this agent."""
         
-        print(f"\n{'='*60}")
-        print(f"📈 EARNINGS REPORT - {self.name}")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            f"📈 EARNINGS REPORT - {self.name}",
+            f"{_SEP_EQ}\n",
+        )
         
         try:
             # Get earnings
@@ -383,12 +425,11 @@ class AutonomousServiceAgent:
             
             if earnings['transactions']:
                 print("Recent Income Transactions:")
-                print("-" * 60)
-                for txn in earnings['transactions'][:5]:
-                    print(f"  • ${txn['amount'] / 100:.2f} from {txn['from_agent']}")
-                    print(f"    {txn['purpose']}")
-                    print(f"    {txn['timestamp']}")
-                    print()
+                print(_SEP_DASH)
+                sys.stdout.write("".join(
+                    _INCOME_ROW_FMT.format_map({**txn, 'amount': txn['amount'] / 100})
+                    for txn in earnings['transactions'][:5]
+                ))
             else:
                 print("No income transactions yet.\n")
             
@@ -401,14 +442,16 @@ class AutonomousServiceAgent:
             # Get balance summary
             summary = self.sdk.get_agent_balance_summary(self.agent_id)
             
-            print("=" * 60)
-            print(f"💼 NET PROFIT: ${summary['net_profit'] / 100:.2f}")
-            print("=" * 60)
+            _emit(
+                _SEP_EQ,
+                f"💼 NET PROFIT: ${summary['net_profit'] / 100:.2f}",
+                _SEP_EQ,
+            )
             
         except Exception as e:
             print(f"❌ Error generating report: {e}\n")
     
-    def run_earning_scenario(self, client_agent_id: str, service_price: int = 5000):
+    async def run_earning_scenario(self, client_agent_id: str, service_price: int = 5000):
         """
         Run a scenario where this agent provides a service and earns money.
         
@@ -417,9 +460,11 @@ class AutonomousServiceAgent:
             service_price: Price for the service (default $50)
         """
         
-        print(f"\n{'#'*60}")
-        print(f"# EARNING SCENARIO: {self.service_type} Service")
-        print(f"{'#'*60}\n")
+        _emit(
+            f"\n{_SEP_HASH}",
+            f"# EARNING SCENARIO: {self.service_type} Service",
+            f"{_SEP_HASH}\n",
+        )
         
         service_descriptions = {
             "Analytics": "Advanced Campaign Analytics Report",
@@ -431,7 +476,7 @@ class AutonomousServiceAgent:
         description = service_descriptions.get(self.service_type, f"{self.service_type} Service")
         
         # Provide service and get paid
-        payment_result = self.provide_service_and_get_paid(
+        payment_result = await self.provide_service_and_get_paid(
             client_agent_id=client_agent_id,
             service_description=description,
             price=service_price
@@ -449,23 +494,29 @@ def main():
     Main function - Run autonomous agent demo with earning capabilities.
     """
     
-    print("\n" + "="*60)
-    print("🎯 AUTONOMOUS AGENT DEMO - EARNING & SPENDING")
-    print("="*60)
-    print("\nThis demo shows TWO modes:")
-    print("  1. REMOTE MODE: Quorum voting for payment approvals")
-    print("  2. LOCAL MODE: Agent-to-agent earning & payments")
-    print()
-    print("=" * 60 + "\n")
+    _load_env()
+    
+    _emit(
+        f"\n{_SEP_EQ}",
+        "🎯 AUTONOMOUS AGENT DEMO - EARNING & SPENDING",
+        _SEP_EQ,
+        "\nThis demo shows TWO modes:",
+        "  1. REMOTE MODE: Quorum voting for payment approvals",
+        "  2. LOCAL MODE: Agent-to-agent earning & payments",
+        "",
+        f"{_SEP_EQ}\n",
+    )
     
     # Get API key from environment or user input
     api_key = os.getenv('AGENTPAY_API_KEY')
     
     if not api_key:
-        print("⚠️  No API key found in environment.")
-        print("\nChoose a mode:")
-        print("  1. REMOTE MODE - Enter API key (tests quorum voting)")
-        print("  2. LOCAL MODE  - Press Enter (tests agent earning)")
+        _emit(
+            "⚠️  No API key found in environment.",
+            "\nChoose a mode:",
+            "  1. REMOTE MODE - Enter API key (tests quorum voting)",
+            "  2. LOCAL MODE  - Press Enter (tests agent earning)",
+        )
         choice = input("\nYour choice: ").strip()
         
         if choice and choice != "2":
@@ -473,9 +524,11 @@ def main():
     
     # Run appropriate mode
     if api_key:
-        print("\n" + "="*60)
-        print("🌐 RUNNING IN REMOTE MODE (Quorum Voting)")
-        print("="*60 + "\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            "🌐 RUNNING IN REMOTE MODE (Quorum Voting)",
+            f"{_SEP_EQ}\n",
+        )
         
         agent = AutonomousMarketingAgent(api_key=api_key)
         
@@ -484,48 +537,53 @@ def main():
             ("analytics", "Should APPROVE - Clear value, medium urgency"),
         ]
         
-        results = []
+        # Each scenario is an independent quorum request, so dispatch them all at
+        # once and then print each one's output as a block, in order
+        outcomes = asyncio.run(
+            run_all_buffered(agent.run_scenario, [scenario for scenario, _ in scenarios])
+        )
         
-        for i, (scenario, description) in enumerate(scenarios, 1):
-            print(f"\n{'#'*60}")
-            print(f"# SCENARIO {i}/{len(scenarios)}: {description}")
-            print(f"{'#'*60}\n")
-            
-            result = agent.run_scenario(scenario)
+        results = []
+        for i, ((_, description), (result, output)) in enumerate(zip(scenarios, outcomes), 1):
+            _emit(
+                f"\n{_SEP_HASH}",
+                f"# SCENARIO {i}/{len(scenarios)}: {description}",
+                f"{_SEP_HASH}\n",
+            )
+            sys.stdout.write(output)
             results.append(result)
-            
-            if i < len(scenarios):
-                time.sleep(2)
         
         # Summary
-        print(f"\n\n{'#'*60}")
-        print("# REMOTE MODE SUMMARY")
-        print(f"{'#'*60}\n")
+        _emit(
+            f"\n\n{_SEP_HASH}",
+            "# REMOTE MODE SUMMARY",
+            f"{_SEP_HASH}\n",
+        )
         
         for i, result in enumerate(results, 1):
             status = "✅ SUCCESS" if result['purchased'] else ("⏸️  DENIED" if not result['approved'] else "❌ FAILED")
             print(f"{i}. {result['scenario'].upper()}: {status}")
         
-        print(f"{'#'*60}\n")
+        print(f"{_SEP_HASH}\n")
     
     else:
-        print("\n" + "="*60)
-        print("🏠 RUNNING IN LOCAL MODE (Agent-to-Agent Earning)")
-        print("="*60 + "\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            "🏠 RUNNING IN LOCAL MODE (Agent-to-Agent Earning)",
+            f"{_SEP_EQ}\n",
+        )
         
         # Create SDK in local mode
         sdk = AgentPaySDK()
         
         # Register two agents
         print("📝 Registering agents...")
-        marketing_agent = sdk.register_agent(
-            "marketing-agent-001",
-            metadata={"name": "Marketing Agent", "role": "marketing"}
-        )
-        service_agent = sdk.register_agent(
-            "analytics-agent-002", 
-            metadata={"name": "Analytics Agent", "role": "service_provider"}
-        )
+        marketing_agent, service_agent = sdk.register_agents([
+            {"agent_id": "marketing-agent-001",
+             "metadata": {"name": "Marketing Agent", "role": "marketing"}},
+            {"agent_id": "analytics-agent-002",
+             "metadata": {"name": "Analytics Agent", "role": "service_provider"}},
+        ])
         
         # Fund the marketing agent (they'll pay for services)
         print("💰 Funding marketing agent with $500...\n")
@@ -539,34 +597,43 @@ def main():
         )
         
         # Run earning scenario
-        print(f"\n{'#'*60}")
-        print("# SCENARIO: Agent Provides Service & Earns Money")
-        print(f"{'#'*60}\n")
+        _emit(
+            f"\n{_SEP_HASH}",
+            "# SCENARIO: Agent Provides Service & Earns Money",
+            f"{_SEP_HASH}\n",
+        )
         
-        analytics_agent.run_earning_scenario(
+        asyncio.run(analytics_agent.run_earning_scenario(
             client_agent_id="marketing-agent-001",
             service_price=7500  # $75
-        )
+        ))
         
         # Show final balances for both agents
-        print(f"\n{'='*60}")
-        print("📊 FINAL AGENT BALANCES")
-        print(f"{'='*60}\n")
+        _emit(
+            f"\n{_SEP_EQ}",
+            "📊 FINAL AGENT BALANCES",
+            f"{_SEP_EQ}\n",
+        )
+        
+        summaries = sdk.get_balance_summaries(["marketing-agent-001", "analytics-agent-002"])
         
-        for agent_id in ["marketing-agent-001", "analytics-agent-002"]:
-            agent = sdk.get_agent(agent_id)
-            summary = sdk.get_agent_balance_summary(agent_id)
+        for agent in [marketing_agent, service_agent]:
+            summary = summaries[agent.agent_id]
             
-            print(f"{agent.display_name} ({agent_id})")
-            print(f"  Balance: ${summary['current_balance'] / 100:.2f}")
-            print(f"  Earned: ${summary['total_earned'] / 100:.2f}")
-            print(f"  Spent: ${summary['total_spent'] / 100:.2f}")
-            print(f"  Net Profit: ${summary['net_profit'] / 100:.2f}")
-            print()
-        
-        print("="*60)
-        print("✅ LOCAL MODE DEMO COMPLETE")
-        print("="*60 + "\n")
+            _emit(
+                f"{agent.display_name} ({agent.agent_id})",
+                f"  Balance: ${summary['current_balance'] / 100:.2f}",
+                f"  Earned: ${summary['total_earned'] / 100:.2f}",
+                f"  Spent: ${summary['total_spent'] / 100:.2f}",
+                f"  Net Profit: ${summary['net_profit'] / 100:.2f}",
+                "",
+            )
+        
+        _emit(
+            _SEP_EQ,
+            "✅ LOCAL MODE DEMO COMPLETE",
+            f"{_SEP_EQ}\n",
+        )
 
 
 if __name__ == "__main__":
@@ -10,19 +10,40 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from agentpay import AgentPaySDK
 
+# Section separators used by the console output
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
+
+# One row of the final balance table, filled in with str.format_map
+_ROW_FMT = "{name:<20} ${balance:>10.2f}  ${earned:>10.2f}  ${spent:>10.2f}  ${profit:>10.2f}"
+
+# One income / expense transaction in the reports, filled in with str.format_map
+_INCOME_ROW_FMT = (
+    "  • ${amount:.2f} from {from_agent}\n"
+    "    Purpose: {purpose}\n"
+    "    Time: {timestamp}\n"
+    "    Balance after: ${balance_after:.2f}\n\n"
+)
+_EXPENSE_ROW_FMT = (
+    "  • ${amount:.2f} to {to_agent}\n"
+    "    Purpose: {purpose}\n"
+    "    Time: {timestamp}\n"
+    "    Balance after: ${balance_after:.2f}\n\n"
+)
+
 
 def print_header(title):
     """Print a formatted header."""
-    print(f"\n{'='*70}")
+    print(f"\n{_SEP_EQ}")
     print(f"{title:^70}")
-    print(f"{'='*70}\n")
+    print(f"{_SEP_EQ}\n")
 
 
 def print_section(title):
     """Print a section divider."""
-    print(f"\n{'-'*70}")
+    print(f"\n{_SEP_DASH}")
     print(f"  {title}")
-    print(f"{'-'*70}\n")
+    print(f"{_SEP_DASH}\n")
 
 
 def main():
@@ -41,18 +62,16 @@ def main():
     # ========== SETUP ==========
     print_section("1️⃣  SETUP: Registering Agents")
     
-    # Register Agent A (buyer/spender)
-    agent_a = sdk.register_agent(
-        "agent-a",
-        metadata={"name": "Marketing Agent", "role": "buyer"}
-    )
+    # Register the buyer, the service provider and the vendor it buys tools from
+    agent_a, agent_b, vendor = sdk.register_agents([
+        {"agent_id": "agent-a",
+         "metadata": {"name": "Marketing Agent", "role": "buyer"}},
+        {"agent_id": "agent-b",
+         "metadata": {"name": "Analytics Agent", "role": "service_provider"}},
+        {"agent_id": "vendor-c",
+         "metadata": {"name": "Tool Vendor"}},
+    ])
     print(f"✅ Registered: {agent_a.display_name} ({agent_a.agent_id})")
-    
-    # Register Agent B (service provider/earner)
-    agent_b = sdk.register_agent(
-        "agent-b",
-        metadata={"name": "Analytics Agent", "role": "service_provider"}
-    )
     print(f"✅ Registered: {agent_b.display_name} ({agent_b.agent_id})")
     
     # Fund Agent A
@@ -93,18 +112,18 @@ def main():
     print(f"📊 Number of Income Transactions: {earnings['transaction_count']}\n")
     
     print("Income Transactions:")
-    for txn in earnings['transactions']:
-        print(f"  • ${txn['amount'] / 100:.2f} from {txn['from_agent']}")
-        print(f"    Purpose: {txn['purpose']}")
-        print(f"    Time: {txn['timestamp']}")
-        print(f"    Balance after: ${txn['balance_after'] / 100:.2f}\n")
+    sys.stdout.write("".join(
+        _INCOME_ROW_FMT.format_map({
+            **txn,
+            'amount': txn['amount'] / 100,
+            'balance_after': txn['balance_after'] / 100,
+        })
+        for txn in earnings['transactions']
+    ))
     
     # ========== AGENT B SPENDS SOME MONEY ==========
     print_section("5️⃣  SPENDING: Agent B pays for tools")
     
-    # Register a vendor agent (no need to fund them)
-    vendor = sdk.register_agent("vendor-c", metadata={"name": "Tool Vendor"})
-    
     print("Agent B buys analytics tools for $25\n")
     
     sdk.transfer_to_agent(
@@ -123,35 +142,41 @@ def main():
     print(f"📊 Number of Expense Transactions: {expenses['transaction_count']}\n")
     
     print("Expense Transactions:")
-    for txn in expenses['transactions']:
-        print(f"  • ${abs(txn['amount']) / 100:.2f} to {txn['to_agent']}")
-        print(f"    Purpose: {txn['purpose']}")
-        print(f"    Time: {txn['timestamp']}")
-        print(f"    Balance after: ${txn['balance_after'] / 100:.2f}\n")
+    sys.stdout.write("".join(
+        _EXPENSE_ROW_FMT.format_map({
+            **txn,
+            'amount': abs(txn['amount']) / 100,
+            'balance_after': txn['balance_after'] / 100,
+        })
+        for txn in expenses['transactions']
+    ))
     
     # ========== FINAL SUMMARY ==========
     print_section("7️⃣  FINAL SUMMARY: All Agent Balances")
     
     print(f"{'Agent':<20} {'Balance':>12} {'Earned':>12} {'Spent':>12} {'Net Profit':>12}")
-    print("-" * 70)
+    print(_SEP_DASH)
     
-    for agent_id in ["agent-a", "agent-b", "vendor-c"]:
-        agent = sdk.get_agent(agent_id)
-        summary = sdk.get_agent_balance_summary(agent_id)
-        
-        print(f"{agent.display_name:<20} "
-              f"${summary['current_balance']/100:>10.2f}  "
-              f"${summary['total_earned']/100:>10.2f}  "
-              f"${summary['total_spent']/100:>10.2f}  "
-              f"${summary['net_profit']/100:>10.2f}")
+    summaries = sdk.get_balance_summaries(["agent-a", "agent-b", "vendor-c"])
     
-    print("\n" + "="*70)
+    for agent in [agent_a, agent_b, vendor]:
+        summary = summaries[agent.agent_id]
+        
+        print(_ROW_FMT.format_map({
+            'name': agent.display_name,
+            'balance': summary['current_balance'] / 100,
+            'earned': summary['total_earned'] / 100,
+            'spent': summary['total_spent'] / 100,
+            'profit': summary['net_profit'] / 100,
+        }))
+    
+    print(f"\n{_SEP_EQ}")
     print("KEY INSIGHTS:")
-    print("="*70)
+    print(_SEP_EQ)
     
-    summary_b = sdk.get_agent_balance_summary("agent-b")
+    agent_b, summary_b = sdk.get_agent_full("agent-b")
     
-    print(f"\n🎯 Agent B (Analytics Agent):")
+    print(f"\n🎯 Agent B ({agent_b.display_name}):")
     print(f"   • Started with: $0.00")
     print(f"   • Earned from services: ${summary_b['total_earned'] / 100:.2f}")
     print(f"   • Spent on tools: ${summary_b['total_spent'] / 100:.2f}")
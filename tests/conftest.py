@@ -0,0 +1,162 @@
+"""Shared pytest fixtures.
+
+The FastAPI app (and httpx) are imported inside the API fixtures rather than
+at module level, so runs that only select unit tests (``pytest -m unit``)
+never load the HTTP stack.
+"""
+
+import itertools
+import uuid
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+from agentpay import AgentPaySDK, Policy
+
+
+# Modules that mint IDs with uuid4(): the SDK's payment/escrow paths and model defaults
+_UUID_MODULES = (
+    "agentpay.sdk",
+    "agentpay.escrow_manager",
+    "agentpay.models.agent",
+    "agentpay.models.ledger",
+    "agentpay.models.payment",
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark every test that talks to the HTTP API as ``e2e``."""
+    for item in items:
+        if "aclient" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.e2e)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests (via anyio's pytest plugin) on asyncio, with uvloop if available."""
+    # uvloop is optional and not available on Windows
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return ("asyncio", {})
+    return ("asyncio", {"use_uvloop": True})
+
+
+@pytest.fixture(scope="module")
+def _fast_ids():
+    """Replace uuid4() with a counter-backed sequence of stable UUIDs for one module.
+    
+    IDs stay unique and keep the UUID string format, without reading the
+    kernel RNG for every payment, ledger entry and escrow.
+    """
+    counter = itertools.count()
+    
+    def _next_uuid() -> uuid.UUID:
+        return uuid.UUID(int=next(counter))
+    
+    with pytest.MonkeyPatch.context() as mp:
+        for module in _UUID_MODULES:
+            mp.setattr(f"{module}.uuid4", _next_uuid)
+        yield
+
+
+@pytest.fixture(scope="module")
+def _module_sdk(_fast_ids):
+    """SDK instance shared by every test in a module (see ``sdk``)."""
+    return AgentPaySDK()
+
+
+@pytest.fixture
+def sdk(_module_sdk: AgentPaySDK) -> AgentPaySDK:
+    """The module's shared SDK, with agents, ledger, payments and escrows cleared.
+    
+    Clearing in place is cheaper than building a fresh SDK per test, and far
+    cheaper than deep-copying an empty template instance.
+    """
+    _module_sdk.clear_all()
+    return _module_sdk
+
+
+@pytest.fixture
+def funded_pair(make_agent):
+    """Register alice and bob and fund alice with 10000."""
+    return make_agent("alice", balance=10000), make_agent("bob")
+
+
+@pytest.fixture(scope="session")
+def api_sdk():
+    """SDK instance served by the API app, private to this test session.
+    
+    Each pytest-xdist worker runs its own session, so workers never share
+    SDK state. The app's original SDK is restored afterwards.
+    """
+    from agentpay.api.app import app
+    
+    original = app.state.sdk
+    app.state.sdk = AgentPaySDK()
+    yield app.state.sdk
+    app.state.sdk = original
+
+
+@pytest.fixture(scope="session")
+async def _session_aclient(api_sdk: AgentPaySDK):
+    """One in-process AsyncClient for the whole test session.
+    
+    The OpenAPI schema and first request are warmed up here, so their one-time
+    cost is not charged to whichever test happens to run first.
+    """
+    from httpx import ASGITransport, AsyncClient
+    from agentpay.api.app import app
+    
+    app.openapi()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        await c.get("/v1/agents")
+        yield c
+
+
+@pytest.fixture
+def aclient(_session_aclient, api_sdk: AgentPaySDK):
+    """Shared AsyncClient, with the served SDK's state cleared before each test."""
+    api_sdk.clear_all()
+    return _session_aclient
+
+
+@pytest.fixture
+def seed(aclient, api_sdk: AgentPaySDK) -> Callable[..., None]:
+    """Register (and optionally fund) agents in-process, bypassing the HTTP layer.
+    
+    Depends on ``aclient`` so seeding always happens after the per-test reset.
+    Tests of the endpoints themselves should keep going through the client.
+    
+    Example:
+        ```python
+        seed(["alice", "bob"], ("alice", 10000))
+        ```
+    """
+    def _seed(agent_ids: List[str], fund: Optional[Tuple[str, int]] = None) -> None:
+        api_sdk.register_agents([{"agent_id": agent_id} for agent_id in agent_ids])
+        if fund:
+            api_sdk.fund_agent(*fund)
+    
+    return _seed
+
+
+@pytest.fixture
+def make_agent(sdk: AgentPaySDK) -> Callable[..., str]:
+    """Factory that registers an agent on ``sdk``, optionally funded and with a policy.
+    
+    Policy keyword arguments (``max_per_transaction``, ``allowlist``,
+    ``paused``) are passed to ``Policy``.
+    
+    Example:
+        ```python
+        alice = make_agent("alice", balance=10000, max_per_transaction=1000, allowlist={"bob"})
+        ```
+    """
+    def _make_agent(agent_id: str, balance: int = 0, **policy_kwargs) -> str:
+        policy = Policy(**policy_kwargs) if policy_kwargs else None
+        sdk.register_agent(agent_id, policy=policy)
+        if balance:
+            sdk.fund_agent(agent_id, balance)
+        return agent_id
+    
+    return _make_agent
@@ -0,0 +1,117 @@
+"""Tests for agent capability matching and the per-agent capability index."""
+
+import pytest
+from agents.base.base_agent import BaseAgent
+from agents.base.capabilities import (
+    AgentCapability,
+    CapabilityLevel,
+    CapabilityMatcher,
+    CapabilityProfile,
+)
+
+pytestmark = pytest.mark.unit
+
+_ANALYSIS = AgentCapability.DATA_ANALYSIS
+_WRITING = AgentCapability.CONTENT_WRITING
+
+
+def _profile(capability: AgentCapability, level: CapabilityLevel, *specializations: str):
+    """Build a CapabilityProfile from positional arguments."""
+    return CapabilityProfile(
+        capability=capability, level=level, specializations=list(specializations)
+    )
+
+
+@pytest.fixture
+def profiles():
+    """An intermediate and an expert analysis profile, plus a beginner writing one."""
+    return [
+        _profile(_ANALYSIS, CapabilityLevel.INTERMEDIATE),
+        _profile(_WRITING, CapabilityLevel.BEGINNER),
+        _profile(_ANALYSIS, CapabilityLevel.EXPERT),
+    ]
+
+
+class _StubAgent(BaseAgent):
+    """Minimal concrete agent for exercising BaseAgent's capability helpers."""
+    
+    def execute_task(self, task):
+        raise NotImplementedError
+
+
+class TestCapabilityMatcher:
+    """Tests for CapabilityMatcher."""
+    
+    def test_find_best_match(self, profiles):
+        """Test the highest-level match is returned."""
+        def best(capability, min_level=None):
+            return CapabilityMatcher.find_best_match(profiles, capability, min_level)
+        
+        assert best(_ANALYSIS) is profiles[2]
+        assert best(_ANALYSIS, CapabilityLevel.EXPERT) is profiles[2]
+        assert best(_WRITING) is profiles[1]
+        assert best(_WRITING, CapabilityLevel.INTERMEDIATE) is None
+        assert best(AgentCapability.TRANSLATION) is None
+    
+    def test_build_index(self, profiles):
+        """Test profiles are grouped by capability, highest level first."""
+        index = CapabilityMatcher.build_index(profiles)
+        
+        assert index == {_ANALYSIS: [profiles[2], profiles[0]], _WRITING: [profiles[1]]}
+    
+    def test_add_to_index_keeps_equal_levels_in_insertion_order(self, profiles):
+        """Test profiles of the same level stay in the order they were added."""
+        index = CapabilityMatcher.build_index(profiles)
+        second_expert = _profile(_ANALYSIS, CapabilityLevel.EXPERT, "time series")
+        
+        CapabilityMatcher.add_to_index(index, second_expert)
+        
+        assert index[_ANALYSIS] == [profiles[2], second_expert, profiles[0]]
+    
+    @pytest.mark.parametrize("capability", [_ANALYSIS, _WRITING, AgentCapability.TRANSLATION])
+    @pytest.mark.parametrize("min_level", [None, *CapabilityLevel])
+    def test_find_best_match_in_index_agrees_with_scan(self, profiles, capability, min_level):
+        """Test the index lookup returns the same profile as a full scan."""
+        index = CapabilityMatcher.build_index(profiles)
+        
+        assert CapabilityMatcher.find_best_match_in_index(
+            index, capability, min_level
+        ) is CapabilityMatcher.find_best_match(profiles, capability, min_level)
+    
+    def test_suggest_related_capabilities(self):
+        """Test related capabilities come back in their listed order."""
+        assert CapabilityMatcher.suggest_related_capabilities(
+            AgentCapability.MARKET_RESEARCH
+        ) == [
+            AgentCapability.COMPETITIVE_ANALYSIS,
+            AgentCapability.DATA_ANALYSIS,
+            AgentCapability.WEB_SCRAPING,
+        ]
+        assert CapabilityMatcher.suggest_related_capabilities(AgentCapability.TRANSLATION) == []
+
+
+class TestBaseAgentCapabilities:
+    """Tests for BaseAgent's capability list and index."""
+    
+    def test_has_capability(self, sdk):
+        """Test lookups see capabilities added through add_capability."""
+        agent = _StubAgent(sdk, "analyst", "Analyst")
+        assert agent.has_capability(_ANALYSIS) is False
+        
+        agent.add_capability(_ANALYSIS, CapabilityLevel.INTERMEDIATE)
+        agent.add_capability(_ANALYSIS, CapabilityLevel.ADVANCED)
+        
+        assert agent.has_capability(_ANALYSIS, CapabilityLevel.ADVANCED) is True
+        assert agent.has_capability(_ANALYSIS, CapabilityLevel.EXPERT) is False
+        assert agent.has_capability(_WRITING) is False
+        assert [c.level for c in agent.capabilities] == [
+            CapabilityLevel.INTERMEDIATE, CapabilityLevel.ADVANCED
+        ]
+    
+    def test_capabilities_is_read_only(self, sdk):
+        """Test capabilities can't be added behind the index's back."""
+        agent = _StubAgent(sdk, "analyst", "Analyst")
+        
+        with pytest.raises(AttributeError):
+            agent.capabilities.append(_profile(_ANALYSIS, CapabilityLevel.EXPERT))
+        assert agent.has_capability(_ANALYSIS) is False
@@ -1,7 +1,7 @@
 """Unit tests for core data models."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, UTC
 
 from agentpay.models import (
     Wallet,
@@ -13,13 +13,47 @@ from agentpay.models import (
     EntryType,
 )
 
+# Model defaults mint IDs through conftest's counter-backed uuid4 stand-in
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("_fast_ids")]
+
+# Model modules whose timestamp defaults are swapped for a frozen clock
+_CLOCK_MODULES = ("agentpay.models.payment", "agentpay.models.ledger")
+
+
+class _FrozenClock:
+    """Stand-in for ``datetime`` that always reports the same instant."""
+    
+    _NOW = datetime(2024, 1, 1, tzinfo=UTC)
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls._NOW
+
+
+@pytest.fixture(autouse=True)
+def _frozen_clock(monkeypatch):
+    """Avoid real clock reads in model defaults and ``mark_*``.
+    
+    Fields still get real ``datetime`` values.
+    """
+    for module in _CLOCK_MODULES:
+        monkeypatch.setattr(f"{module}.datetime", _FrozenClock)
+
+
+def _mk(cls, **kwargs):
+    """Build a model without validation, for tests that only read fields or call methods.
+    
+    Tests of validation behaviour must construct models normally.
+    """
+    return cls.model_construct(**kwargs)
+
 
 class TestWallet:
     """Tests for Wallet model."""
     
     def test_wallet_creation_defaults(self):
         """Test wallet is created with zero balance and hold."""
-        wallet = Wallet()
+        wallet = _mk(Wallet)
         assert wallet.balance == 0
         assert wallet.hold == 0
         assert wallet.total == 0
@@ -51,12 +85,24 @@ class TestWallet:
         assert wallet.can_hold(1001) is False
 
 
+@pytest.fixture(scope="module")
+def empty_policy():
+    """Unrestricted policy shared by read-only tests (do not mutate)."""
+    return Policy()
+
+
+@pytest.fixture(scope="module")
+def capped_policy():
+    """Policy with a 1000 per-transaction cap shared by read-only tests (do not mutate)."""
+    return Policy(max_per_transaction=1000)
+
+
 class TestPolicy:
     """Tests for Policy model."""
     
-    def test_policy_defaults(self):
+    def test_policy_defaults(self, empty_policy):
         """Test default policy has no restrictions."""
-        policy = Policy()
+        policy = empty_policy
         assert policy.max_per_transaction is None
         assert policy.daily_spend_cap is None
         assert policy.require_human_approval_over is None
@@ -74,10 +120,9 @@ class TestPolicy:
         assert policy.daily_spend_cap == 20000
         assert policy.require_human_approval_over == 10000
     
-    def test_policy_is_agent_allowed_no_allowlist(self):
+    def test_policy_is_agent_allowed_no_allowlist(self, empty_policy):
         """Test allowlist check with no allowlist (all allowed)."""
-        policy = Policy()
-        assert policy.is_agent_allowed("any-agent-id") is True
+        assert empty_policy.is_agent_allowed("any-agent-id") is True
     
     def test_policy_is_agent_allowed_with_allowlist(self):
         """Test allowlist enforcement."""
@@ -86,17 +131,16 @@ class TestPolicy:
         assert policy.is_agent_allowed("agent-2") is True
         assert policy.is_agent_allowed("agent-3") is False
     
-    def test_policy_is_amount_allowed(self):
+    def test_policy_is_amount_allowed(self, capped_policy):
         """Test per-transaction limit check."""
-        policy = Policy(max_per_transaction=1000)
+        policy = capped_policy
         assert policy.is_amount_allowed(500) is True
         assert policy.is_amount_allowed(1000) is True
         assert policy.is_amount_allowed(1001) is False
     
-    def test_policy_is_amount_allowed_no_limit(self):
+    def test_policy_is_amount_allowed_no_limit(self, empty_policy):
         """Test amount check with no limit."""
-        policy = Policy()
-        assert policy.is_amount_allowed(999999999) is True
+        assert empty_policy.is_amount_allowed(999999999) is True
     
     def test_policy_requires_approval(self):
         """Test approval requirement check."""
@@ -143,44 +187,25 @@ class TestAgent:
         assert can_pay is True
         assert reason is None
     
-    def test_agent_can_pay_paused(self):
-        """Test can_pay fails when agent is paused."""
-        agent = Agent()
-        agent.policy.paused = True
-        agent.wallet.balance = 10000
-        
-        can_pay, reason = agent.can_pay(5000, "recipient-123")
-        assert can_pay is False
-        assert reason == "AGENT_PAUSED"
-    
-    def test_agent_can_pay_not_in_allowlist(self):
-        """Test can_pay fails when recipient not in allowlist."""
-        agent = Agent()
-        agent.policy.allowlist = {"allowed-agent"}
-        agent.wallet.balance = 10000
-        
-        can_pay, reason = agent.can_pay(5000, "not-allowed")
-        assert can_pay is False
-        assert reason == "RECIPIENT_NOT_ALLOWED"
-    
-    def test_agent_can_pay_exceeds_limit(self):
-        """Test can_pay fails when amount exceeds limit."""
+    @pytest.mark.parametrize(
+        "mutate, amount, recipient, expected_reason",
+        [
+            (lambda a: setattr(a.policy, "paused", True), 5000, "recipient-123", "AGENT_PAUSED"),
+            (lambda a: setattr(a.policy, "allowlist", {"allowed-agent"}), 5000, "not-allowed", "RECIPIENT_NOT_ALLOWED"),
+            (lambda a: setattr(a.policy, "max_per_transaction", 1000), 2000, "recipient-123", "AMOUNT_EXCEEDS_LIMIT"),
+            (lambda a: setattr(a.wallet, "balance", 100), 500, "recipient-123", "INSUFFICIENT_FUNDS"),
+        ],
+        ids=["paused", "not_in_allowlist", "exceeds_limit", "insufficient_funds"],
+    )
+    def test_agent_can_pay_rejected(self, mutate, amount, recipient, expected_reason):
+        """Test can_pay fails with the reason for each violated check."""
         agent = Agent()
-        agent.policy.max_per_transaction = 1000
         agent.wallet.balance = 10000
+        mutate(agent)
         
-        can_pay, reason = agent.can_pay(2000, "recipient-123")
+        can_pay, reason = agent.can_pay(amount, recipient)
         assert can_pay is False
-        assert reason == "AMOUNT_EXCEEDS_LIMIT"
-    
-    def test_agent_can_pay_insufficient_funds(self):
-        """Test can_pay fails with insufficient funds."""
-        agent = Agent()
-        agent.wallet.balance = 100
-        
-        can_pay, reason = agent.can_pay(500, "recipient-123")
-        assert can_pay is False
-        assert reason == "INSUFFICIENT_FUNDS"
+        assert reason == expected_reason
 
 
 class TestPaymentIntent:
@@ -223,7 +248,8 @@ class TestPaymentIntent:
     
     def test_payment_intent_mark_completed(self):
         """Test marking payment as completed."""
-        intent = PaymentIntent(
+        intent = _mk(
+            PaymentIntent,
             from_agent_id="agent-1",
             to_agent_id="agent-2",
             amount=1000
@@ -236,7 +262,8 @@ class TestPaymentIntent:
     
     def test_payment_intent_mark_failed_policy(self):
         """Test marking payment as failed due to policy."""
-        intent = PaymentIntent(
+        intent = _mk(
+            PaymentIntent,
             from_agent_id="agent-1",
             to_agent_id="agent-2",
             amount=1000
@@ -249,7 +276,8 @@ class TestPaymentIntent:
     
     def test_payment_intent_mark_failed_funds(self):
         """Test marking payment as failed due to insufficient funds."""
-        intent = PaymentIntent(
+        intent = _mk(
+            PaymentIntent,
             from_agent_id="agent-1",
             to_agent_id="agent-2",
             amount=1000
@@ -261,7 +289,8 @@ class TestPaymentIntent:
     
     def test_payment_intent_mark_cancelled(self):
         """Test marking payment as cancelled."""
-        intent = PaymentIntent(
+        intent = _mk(
+            PaymentIntent,
             from_agent_id="agent-1",
             to_agent_id="agent-2",
             amount=1000
@@ -286,7 +315,8 @@ class TestLedgerEntry:
     
     def test_ledger_entry_creation(self):
         """Test ledger entry is created correctly."""
-        entry = LedgerEntry(
+        entry = _mk(
+            LedgerEntry,
             agent_id="agent-1",
             delta_amount=-1000,
             entry_type=EntryType.PAYMENT,
@@ -303,7 +333,8 @@ class TestLedgerEntry:
     
     def test_ledger_entry_is_debit(self):
         """Test is_debit property for negative amounts."""
-        entry = LedgerEntry(
+        entry = _mk(
+            LedgerEntry,
             agent_id="agent-1",
             delta_amount=-500,
             entry_type=EntryType.PAYMENT,
@@ -315,7 +346,8 @@ class TestLedgerEntry:
     
     def test_ledger_entry_is_credit(self):
         """Test is_credit property for positive amounts."""
-        entry = LedgerEntry(
+        entry = _mk(
+            LedgerEntry,
             agent_id="agent-2",
             delta_amount=500,
             entry_type=EntryType.PAYMENT,
@@ -327,7 +359,8 @@ class TestLedgerEntry:
     
     def test_ledger_entry_with_memo(self):
         """Test ledger entry with memo."""
-        entry = LedgerEntry(
+        entry = _mk(
+            LedgerEntry,
             agent_id="agent-1",
             delta_amount=1000,
             entry_type=EntryType.TOP_UP,
@@ -350,11 +383,13 @@ class TestLedgerEntry:
     
     def test_ledger_entry_types(self):
         """Test all entry types are available."""
-        assert EntryType.PAYMENT == "payment"
-        assert EntryType.ESCROW_LOCK == "escrow_lock"
-        assert EntryType.ESCROW_RELEASE == "escrow_release"
-        assert EntryType.ESCROW_CANCEL == "escrow_cancel"
-        assert EntryType.STREAM_TICK == "stream_tick"
-        assert EntryType.TOP_UP == "top_up"
-        assert EntryType.WITHDRAWAL == "withdrawal"
-        assert EntryType.ADJUSTMENT == "adjustment"
+        assert {(e.name, e.value) for e in EntryType} >= {
+            ("PAYMENT", "payment"),
+            ("ESCROW_LOCK", "escrow_lock"),
+            ("ESCROW_RELEASE", "escrow_release"),
+            ("ESCROW_CANCEL", "escrow_cancel"),
+            ("STREAM_TICK", "stream_tick"),
+            ("TOP_UP", "top_up"),
+            ("WITHDRAWAL", "withdrawal"),
+            ("ADJUSTMENT", "adjustment"),
+        }
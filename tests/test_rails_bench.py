@@ -0,0 +1,56 @@
+"""Benchmarks for the internal credits rail's transfer path.
+
+Run with ``pytest tests/test_rails_bench.py --codspeed``. Without the flag
+each benchmark body runs once as a plain test; without pytest-codspeed
+installed the module is skipped.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_codspeed")
+
+from agentpay.models import Agent
+from agentpay.agent_registry import AgentRegistry
+from agentpay.ledger_manager import LedgerManager
+from agentpay.escrow_manager import EscrowManager
+from agentpay.rails import InternalCreditsAdapter, TransactionStatus
+
+# Enough for Alice to cover every benchmark round at 1 cent per transfer
+_BENCH_BALANCE = 10**12
+
+
+def _make_adapter(extra_agents: int = 0) -> InternalCreditsAdapter:
+    """Build an adapter with a funded Alice, Bob and ``extra_agents`` bystanders."""
+    registry = AgentRegistry()
+    ledger = LedgerManager(registry)
+    registry.register_agents(
+        [Agent(agent_id="alice"), Agent(agent_id="bob")]
+        + [Agent(agent_id=f"agent-{i}") for i in range(extra_agents)]
+    )
+    registry.get_agent("alice").wallet.balance = _BENCH_BALANCE
+    return InternalCreditsAdapter(registry, ledger, EscrowManager(registry, ledger))
+
+
+@pytest.mark.benchmark
+def test_transfer_bench(benchmark):
+    """Benchmark a single direct transfer (setup excluded)."""
+    adapter = _make_adapter()
+    
+    txn = benchmark(adapter.transfer, "alice", "bob", 1)
+    
+    assert txn.status == TransactionStatus.COMPLETED
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_transfer_bench_large_registry(benchmark):
+    """Benchmark a transfer with 10,000 registered agents.
+    
+    Should match ``test_transfer_bench``; a gap means transfer has picked
+    up work that grows with the registry.
+    """
+    adapter = _make_adapter(extra_agents=10_000)
+    
+    txn = benchmark(adapter.transfer, "alice", "bob", 1)
+    
+    assert txn.status == TransactionStatus.COMPLETED
@@ -0,0 +1,100 @@
+"""Tests for AgentPaySDK agent management."""
+
+import pytest
+from agentpay import Policy
+
+
+class TestAgentManagement:
+    """Tests for agent management operations."""
+    
+    @pytest.fixture
+    def registered_agent(self, sdk):
+        """Register "test-agent" after the per-test reset."""
+        return sdk.register_agent("test-agent")
+    
+    def test_register_agent_simple(self, sdk):
+        """Test simple agent registration."""
+        agent = sdk.register_agent("test-agent")
+        
+        assert agent.agent_id == "test-agent"
+        assert agent.wallet.balance == 0
+        assert agent.policy.paused is False
+    
+    def test_register_agent_with_metadata(self, sdk):
+        """Test agent registration with metadata."""
+        agent = sdk.register_agent(
+            "alice",
+            metadata={"name": "Alice", "email": "alice@example.com"}
+        )
+        
+        assert agent.agent_id == "alice"
+        assert agent.metadata["name"] == "Alice"
+        assert agent.display_name == "Alice"
+    
+    def test_register_agent_with_policy(self, sdk):
+        """Test agent registration with custom policy."""
+        policy = Policy(max_per_transaction=5000, allowlist={"bob", "charlie"})
+        agent = sdk.register_agent("restricted", policy=policy)
+        
+        assert agent.policy.max_per_transaction == 5000
+        assert "bob" in agent.policy.allowlist
+    
+    def test_duplicate_registration_fails(self, sdk, registered_agent):
+        """Test that duplicate agent IDs are rejected."""
+        with pytest.raises(ValueError, match="already exists"):
+            sdk.register_agent(registered_agent.agent_id)
+    
+    def test_register_agents(self, sdk):
+        """Test registering several agents in one call."""
+        alice, bob = sdk.register_agents([
+            {"agent_id": "alice", "metadata": {"name": "Alice"}},
+            {"agent_id": "bob", "policy": Policy(max_per_transaction=5000)},
+        ])
+        
+        assert alice.display_name == "Alice"
+        assert alice.policy.max_per_transaction is None
+        assert bob.metadata == {}
+        assert bob.policy.max_per_transaction == 5000
+        assert sdk.agent_exists("bob") is True
+        
+        with pytest.raises(ValueError, match="already exists"):
+            sdk.register_agents([{"agent_id": "carol"}, {"agent_id": "alice"}])
+        assert sdk.agent_exists("carol") is False
+    
+    def test_get_agent(self, sdk, registered_agent):
+        """Test getting an agent by ID."""
+        agent = sdk.get_agent("test-agent")
+        assert agent is not None
+        assert agent.agent_id == "test-agent"
+        
+        # Non-existent agent
+        assert sdk.get_agent("nonexistent") is None
+    
+    def test_agent_exists(self, sdk, registered_agent):
+        """Test checking agent existence."""
+        assert sdk.agent_exists("test-agent") is True
+        assert sdk.agent_exists("nonexistent") is False
+    
+    def test_list_agents(self, sdk):
+        """Test listing all agents."""
+        sdk.register_agents([{"agent_id": f"agent-{i}"} for i in range(1, 4)])
+        
+        assert {a.agent_id for a in sdk.list_agents()} == {"agent-1", "agent-2", "agent-3"}
+        assert len(sdk.list_agents()) == 3
+    
+    def test_update_agent_policy(self, sdk, registered_agent):
+        """Test updating an agent's policy."""
+        new_policy = Policy(max_per_transaction=10000)
+        updated = sdk.update_agent_policy("test-agent", new_policy)
+        
+        assert updated.policy.max_per_transaction == 10000
+    
+    def test_pause_unpause_agent(self, sdk, registered_agent):
+        """Test pausing and unpausing an agent."""
+        # Pause
+        paused = sdk.pause_agent("test-agent")
+        assert paused.policy.paused is True
+        
+        # Unpause
+        unpaused = sdk.unpause_agent("test-agent")
+        assert unpaused.policy.paused is False
@@ -0,0 +1,73 @@
+"""Tests for AgentPaySDK escrow operations."""
+
+import pytest
+from agentpay import EscrowStatus
+
+
+class TestEscrowOperations:
+    """Tests for escrow operations."""
+    
+    def test_create_escrow(self, sdk, funded_pair):
+        """Test creating an escrow."""
+        result = sdk.create_escrow(
+            from_agent="alice",
+            to_agent="bob",
+            amount=5000,
+            memo="Milestone payment"
+        )
+        
+        assert result.success is True
+        assert result.escrow.status == EscrowStatus.LOCKED
+        assert result.escrow.amount == 5000
+        
+        # Check Alice's wallet
+        wallet = sdk.get_wallet("alice")
+        assert wallet.balance == 5000
+        assert wallet.hold == 5000
+    
+    @pytest.mark.parametrize("action,final_status,alice_balance,bob_balance", [
+        pytest.param("release", EscrowStatus.RELEASED, 5000, 5000, id="release"),
+        pytest.param("cancel", EscrowStatus.CANCELLED, 10000, 0, id="cancel"),
+    ])
+    def test_settle_escrow(self, sdk, funded_pair, action, final_status, alice_balance, bob_balance):
+        """Test releasing (funds to Bob) or cancelling (funds back to Alice) an escrow."""
+        create_result = sdk.create_escrow("alice", "bob", 5000)
+        
+        result = getattr(sdk, f"{action}_escrow")(create_result.escrow.escrow_id)
+        
+        assert result.success is True
+        assert result.escrow.status == final_status
+        wallet = sdk.get_wallet("alice")
+        assert wallet.balance == alice_balance
+        assert wallet.hold == 0
+        assert sdk.get_balance("bob") == bob_balance
+    
+    def test_get_escrow(self, sdk, funded_pair):
+        """Test getting an escrow by ID."""
+        create_result = sdk.create_escrow("alice", "bob", 5000)
+        escrow_id = create_result.escrow.escrow_id
+        
+        escrow = sdk.get_escrow(escrow_id)
+        assert escrow is not None
+        assert escrow.amount == 5000
+        assert escrow.from_agent_id == "alice"
+    
+    def test_list_agent_escrows(self, sdk, funded_pair, make_agent):
+        """Test listing escrows for an agent."""
+        make_agent("charlie")
+        
+        # Create escrows
+        sdk.create_escrow("alice", "bob", 2000)
+        sdk.create_escrow("alice", "charlie", 3000)
+        
+        # List by payer
+        payer_escrows = sdk.list_agent_escrows("alice", role="payer")
+        assert len(payer_escrows) == 2
+        
+        # List by recipient
+        recipient_escrows = sdk.list_agent_escrows("bob", role="recipient")
+        assert len(recipient_escrows) == 1
+        
+        # List all
+        all_escrows = sdk.list_agent_escrows("alice", role="all")
+        assert len(all_escrows) == 2
@@ -0,0 +1,30 @@
+"""Tests for AgentPaySDK transaction history."""
+
+
+class TestTransactionHistory:
+    """Tests for transaction history."""
+    
+    def test_get_transaction_history(self, sdk, funded_pair):
+        """Test getting agent transaction history."""
+        sdk.pay("alice", "bob", 3000)
+        
+        # Check Alice's history
+        alice_history = sdk.get_transaction_history("alice")
+        assert len(alice_history) == 2  # Top-up + payment
+        
+        # Check Bob's history
+        bob_history = sdk.get_transaction_history("bob")
+        assert len(bob_history) == 1  # Payment received
+    
+    def test_get_transaction_by_reference(self, sdk, funded_pair):
+        """Test getting transaction by reference ID."""
+        # Make payment
+        result = sdk.pay("alice", "bob", 5000)
+        payment_id = result.payment_intent.intent_id
+        
+        # Get transaction entries
+        entries = sdk.get_transaction_by_reference(payment_id)
+        assert len(entries) == 2  # Debit + Credit
+        
+        # Verify double-entry
+        assert sdk.ledger.verify_double_entry(payment_id) is True
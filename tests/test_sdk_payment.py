@@ -0,0 +1,69 @@
+"""Tests for AgentPaySDK payment operations."""
+
+from agentpay import PaymentStatus
+
+
+class TestPaymentOperations:
+    """Tests for payment operations."""
+    
+    def test_simple_payment(self, sdk, funded_pair):
+        """Test simple payment between agents."""
+        result = sdk.pay(
+            from_agent="alice",
+            to_agent="bob",
+            amount=5000,
+            memo="Test payment"
+        )
+        
+        assert result.success is True
+        assert result.payment_intent.status == PaymentStatus.COMPLETED
+        assert result.payment_intent.amount == 5000
+        
+        # Check balances
+        assert sdk.get_balance("alice") == 5000
+        assert sdk.get_balance("bob") == 5000
+    
+    def test_payment_insufficient_funds(self, sdk, funded_pair):
+        """Test payment with insufficient funds."""
+        result = sdk.pay("alice", "bob", 20000)
+        
+        assert result.success is False
+        assert result.error_code == "INSUFFICIENT_FUNDS"
+    
+    def test_payment_with_idempotency(self, sdk, funded_pair):
+        """Test idempotent payments."""
+        # First payment
+        result1 = sdk.pay(
+            from_agent="alice",
+            to_agent="bob",
+            amount=1000,
+            idempotency_key="unique-key-123"
+        )
+        assert result1.success is True
+        
+        # The key is recorded against the intent that was executed
+        assert sdk.find_by_idempotency_key("unique-key-123") is result1.payment_intent
+        assert sdk.find_by_idempotency_key("unused-key") is None
+        
+        # Second payment with same key
+        result2 = sdk.pay(
+            from_agent="alice",
+            to_agent="bob",
+            amount=1000,
+            idempotency_key="unique-key-123"
+        )
+        assert result2.success is True
+        assert result2.payment_intent.intent_id == result1.payment_intent.intent_id
+        
+        # Balance should only be deducted once
+        assert sdk.get_balance("alice") == 9000
+    
+    def test_get_payment_status(self, sdk, funded_pair):
+        """Test getting payment status."""
+        result = sdk.pay("alice", "bob", 1000)
+        intent_id = result.payment_intent.intent_id
+        
+        # Retrieve status
+        intent = sdk.get_payment_status(intent_id)
+        assert intent is not None
+        assert intent.status == PaymentStatus.COMPLETED
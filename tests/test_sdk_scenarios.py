@@ -0,0 +1,106 @@
+"""Tests for AgentPaySDK end-to-end usage scenarios."""
+
+import pytest
+
+
+class TestEndToEndScenarios:
+    """End-to-end usage scenarios."""
+    
+    def test_complete_workflow(self, sdk):
+        """Test complete agent payment workflow."""
+        # 1. Register agents
+        alice = sdk.register_agent("alice", metadata={"name": "Alice"})
+        bob = sdk.register_agent("bob", metadata={"name": "Bob"})
+        
+        assert alice.display_name == "Alice"
+        assert bob.agent_id == "bob"
+        
+        # 2. Fund Alice
+        entry = sdk.fund_agent("alice", 10000, memo="Initial funding")
+        assert entry.balance_after == 10000
+        
+        # 3. Make a payment
+        payment_result = sdk.pay(
+            from_agent="alice",
+            to_agent="bob",
+            amount=3000,
+            memo="Consulting services"
+        )
+        assert payment_result.success is True
+        
+        # 4. Check balances
+        assert sdk.get_balance("alice") == 7000
+        assert sdk.get_balance("bob") == 3000
+        
+        # 5. Create escrow
+        escrow_result = sdk.create_escrow("alice", "bob", 2000, memo="Milestone 1")
+        assert escrow_result.success is True
+        escrow_id = escrow_result.escrow.escrow_id
+        
+        # 6. Check Alice's wallet state
+        wallet = sdk.get_wallet("alice")
+        assert wallet.balance == 5000
+        assert wallet.hold == 2000
+        assert wallet.total == 7000
+        
+        # 7. Release escrow
+        release_result = sdk.release_escrow(escrow_id)
+        assert release_result.success is True
+        
+        # 8. Final balances
+        assert sdk.get_balance("alice") == 5000
+        assert sdk.get_balance("bob") == 5000
+        
+        # 9. Check transaction history
+        alice_history = sdk.get_transaction_history("alice")
+        assert len(alice_history) == 4  # topup, payment, escrow_lock, escrow_release
+    
+    @pytest.fixture
+    def restricted_alice(self, make_agent):
+        """Register alice (max 1000 per payment, may only pay bob), bob and charlie; fund alice."""
+        make_agent("bob")
+        make_agent("charlie")
+        return make_agent("alice", balance=10000, max_per_transaction=1000, allowlist={"bob"})
+    
+    def test_policy_success(self, sdk, restricted_alice):
+        """Test a payment within limit to an allowed recipient succeeds."""
+        result = sdk.pay(restricted_alice, "bob", 500)
+        assert result.success is True
+    
+    @pytest.mark.parametrize("to,amount,expected_error,pause_first", [
+        pytest.param("bob", 2000, "AMOUNT_EXCEEDS_LIMIT", False, id="exceeds_limit"),
+        pytest.param("charlie", 500, "RECIPIENT_NOT_ALLOWED", False, id="not_in_allowlist"),
+        pytest.param("bob", 100, "AGENT_PAUSED", True, id="paused"),
+    ])
+    def test_policy_rejects(self, sdk, restricted_alice, to, amount, expected_error, pause_first):
+        """Test that policy violations are rejected with the matching error code."""
+        if pause_first:
+            sdk.pause_agent(restricted_alice)
+        
+        result = sdk.pay(restricted_alice, to, amount)
+        
+        assert result.success is False
+        assert result.error_code == expected_error
+    
+    def test_mixed_operations(self, sdk, funded_pair):
+        """Test mixing different operation types."""
+        # Regular payment
+        sdk.pay("alice", "bob", 2000)
+        
+        # Create multiple escrows
+        escrow1 = sdk.create_escrow("alice", "bob", 1000)
+        escrow2 = sdk.create_escrow("alice", "bob", 1500)
+        
+        # Release one, cancel another
+        sdk.release_escrow(escrow1.escrow.escrow_id)
+        sdk.cancel_escrow(escrow2.escrow.escrow_id)
+        
+        # Another payment
+        sdk.pay("alice", "bob", 500)
+        
+        # Check final state
+        # Alice: 10000 - 2000 (pay) - 1000 (escrow released) - 500 (pay) = 6500
+        # (escrow2 was cancelled, so funds returned)
+        # Bob: 2000 + 1000 + 500 = 3500
+        assert sdk.get_balance("alice") == 6500
+        assert sdk.get_balance("bob") == 3500
@@ -0,0 +1,26 @@
+"""Tests for AgentPaySDK utility methods."""
+
+import pytest
+
+
+class TestUtilities:
+    """Tests for utility methods."""
+    
+    def test_clear_all(self, sdk, funded_pair):
+        """Test clearing all data."""
+        sdk.clear_all()
+        
+        # Everything should be gone
+        assert len(sdk.list_agents()) == 0
+        assert sdk.ledger.get_entry_count() == 0
+    
+    @pytest.mark.parametrize("method,args", [
+        ("register_agents", ([{"agent_id": "alice"}],)),
+        ("find_by_idempotency_key", ("key-1",)),
+    ])
+    def test_local_only_helpers_in_remote_mode(self, sdk, monkeypatch, method, args):
+        """Test local-only helpers raise a clear error instead of touching missing components."""
+        monkeypatch.setattr(sdk, "mode", "remote")
+        
+        with pytest.raises(NotImplementedError, match="only available in local mode"):
+            getattr(sdk, method)(*args)
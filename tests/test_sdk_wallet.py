@@ -0,0 +1,70 @@
+"""Tests for AgentPaySDK wallet operations."""
+
+import pytest
+
+
+class TestWalletOperations:
+    """Tests for wallet operations."""
+    
+    def test_fund_agent(self, sdk):
+        """Test funding an agent."""
+        sdk.register_agent("alice")
+        
+        entry = sdk.fund_agent("alice", 10000, memo="Initial funding")
+        
+        assert entry.agent_id == "alice"
+        assert entry.delta_amount == 10000
+        assert entry.balance_after == 10000
+    
+    def test_get_balance(self, sdk):
+        """Test getting agent balance."""
+        sdk.register_agent("alice")
+        sdk.fund_agent("alice", 10000)
+        
+        balance = sdk.get_balance("alice")
+        assert balance == 10000
+    
+    def test_get_balance_nonexistent_agent(self, sdk):
+        """Test getting balance for non-existent agent."""
+        with pytest.raises(ValueError, match="not found"):
+            sdk.get_balance("nonexistent")
+    
+    def test_get_wallet(self, sdk):
+        """Test getting complete wallet info."""
+        sdk.register_agent("alice")
+        sdk.fund_agent("alice", 10000)
+        
+        wallet = sdk.get_wallet("alice")
+        assert wallet.balance == 10000
+        assert wallet.hold == 0
+        assert wallet.total == 10000
+    
+    def test_get_balance_summaries(self, sdk):
+        """Test getting balance summaries for several agents at once."""
+        sdk.register_agent("alice")
+        sdk.register_agent("bob")
+        sdk.fund_agent("alice", 10000)
+        sdk.transfer_to_agent("alice", "bob", 2500, purpose="Service")
+        
+        summaries = sdk.get_balance_summaries(["alice", "bob"])
+        
+        assert list(summaries) == ["alice", "bob"]
+        assert summaries["alice"] == sdk.get_agent_balance_summary("alice")
+        assert summaries["bob"]["current_balance"] == 2500
+        assert summaries["bob"]["total_earned"] == 2500
+        
+        with pytest.raises(ValueError, match="not found"):
+            sdk.get_balance_summaries(["alice", "nonexistent"])
+    
+    def test_get_agent_full(self, sdk):
+        """Test getting an agent and its balance summary together."""
+        sdk.register_agent("alice", metadata={"name": "Alice"})
+        sdk.fund_agent("alice", 10000)
+        
+        agent, summary = sdk.get_agent_full("alice")
+        
+        assert agent.display_name == "Alice"
+        assert summary == sdk.get_agent_balance_summary("alice")
+        
+        with pytest.raises(ValueError, match="not found"):
+            sdk.get_agent_full("nonexistent")
@@ -5,8 +5,14 @@ Tests the interaction between:
 - LedgerManager  
 - PaymentEngine
 - EscrowManager
+
+Every test builds its own components through the function-scoped ``world``
+fixture, so tests share no state and can run on any pytest-xdist worker.
 """
 
+import itertools
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
 from agentpay.models import Agent, PaymentIntent, PaymentStatus
 from agentpay.agent_registry import AgentRegistry
@@ -14,42 +20,37 @@ from agentpay.ledger_manager import LedgerManager
 from agentpay.payment_engine import PaymentEngine, PaymentResult
 from agentpay.escrow_manager import EscrowManager, EscrowStatus
 
-
-@pytest.fixture
-def registry():
-    """Create a fresh agent registry."""
-    return AgentRegistry()
-
-
-@pytest.fixture
-def ledger(registry):
-    """Create a ledger manager."""
-    return LedgerManager(registry)
-
-
-@pytest.fixture
-def payment_engine(registry, ledger):
-    """Create a payment engine."""
-    return PaymentEngine(registry, ledger)
+# Read-only agent metadata shared across tests (Agent validates it into its own dict)
+_META_ALICE = MappingProxyType({"name": "Alice"})
+_META_BOB = MappingProxyType({"name": "Bob"})
 
 
 @pytest.fixture
-def escrow_manager(registry, ledger):
-    """Create an escrow manager."""
-    return EscrowManager(registry, ledger)
+def world():
+    """Fresh registry, ledger, payment engine and escrow manager, wired together."""
+    registry = AgentRegistry()
+    ledger = LedgerManager(registry)
+    # Escrow IDs only need to be unique; a counter avoids UUID generation
+    counter = itertools.count()
+    return SimpleNamespace(
+        registry=registry, ledger=ledger,
+        payment_engine=PaymentEngine(registry, ledger),
+        escrow_manager=EscrowManager(
+            registry, ledger, id_factory=lambda: f"escrow-{next(counter)}"
+        ),
+    )
 
 
 @pytest.fixture
-def funded_agents(registry, ledger):
+def funded_agents(world):
     """Create and fund two test agents."""
-    alice = Agent(agent_id="alice", metadata={"name": "Alice"})
-    bob = Agent(agent_id="bob", metadata={"name": "Bob"})
+    alice = Agent(agent_id="alice", metadata=_META_ALICE)
+    bob = Agent(agent_id="bob", metadata=_META_BOB)
     
-    registry.register_agent(alice)
-    registry.register_agent(bob)
+    world.registry.register_agents([alice, bob])
     
     # Fund Alice with $100
-    ledger.record_top_up("alice", 10000, "topup-alice")
+    world.ledger.record_top_up("alice", 10000, "topup-alice")
     
     return alice, bob
 
@@ -57,202 +58,273 @@ def funded_agents(registry, ledger):
 class TestAgentRegistry:
     """Tests for AgentRegistry."""
     
-    def test_register_and_retrieve_agent(self, registry):
+    def test_register_and_retrieve_agent(self, world):
         """Test registering and retrieving an agent."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
+        world.registry.register_agent(agent)
         
-        retrieved = registry.get_agent("test-agent")
+        retrieved = world.registry.get_agent("test-agent")
         assert retrieved is not None
         assert retrieved.agent_id == "test-agent"
     
-    def test_duplicate_registration_fails(self, registry):
+    def test_duplicate_registration_fails(self, world):
         """Test that duplicate agent IDs are rejected."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
+        world.registry.register_agent(agent)
         
         with pytest.raises(ValueError, match="already exists"):
-            registry.register_agent(agent)
+            world.registry.register_agent(agent)
     
-    def test_agent_exists(self, registry):
+    def test_registry_returns_live_reference(self, world):
+        """Test that get_agent returns the stored instance, not a copy."""
+        agent = Agent(agent_id="test-agent")
+        world.registry.register_agent(agent)
+        
+        assert world.registry.get_agent("test-agent") is agent
+        
+        # Ledger updates are visible through the caller's reference
+        world.ledger.record_top_up("test-agent", 10000, "topup-1")
+        assert agent.wallet.balance == 10000
+    
+    def test_agent_exists(self, world):
         """Test agent_exists method."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
+        world.registry.register_agent(agent)
         
-        assert registry.agent_exists("test-agent") is True
-        assert registry.agent_exists("nonexistent") is False
+        assert world.registry.agent_exists("test-agent") is True
+        assert world.registry.agent_exists("nonexistent") is False
     
-    def test_update_agent(self, registry):
+    def test_update_agent(self, world):
         """Test updating an agent."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
+        world.registry.register_agent(agent)
         
         # Update wallet
         agent.wallet.balance = 5000
-        registry.update_agent(agent)
+        world.registry.update_agent(agent)
         
-        retrieved = registry.get_agent("test-agent")
+        retrieved = world.registry.get_agent("test-agent")
         assert retrieved.wallet.balance == 5000
     
-    def test_list_and_count_agents(self, registry):
+    def test_list_and_count_agents(self, world):
         """Test listing and counting agents."""
-        for i in range(3):
-            registry.register_agent(Agent(agent_id=f"agent-{i}"))
+        world.registry.register_agents([Agent(agent_id=f"agent-{i}") for i in range(3)])
+        
+        assert world.registry.count_agents() == 3
+        assert len(world.registry.list_agents()) == 3
+    
+    def test_register_agents_batch(self, world):
+        """Test registering several agents at once."""
+        agents = world.registry.register_agents([Agent(agent_id=f"agent-{i}") for i in range(3)])
+        
+        assert [a.agent_id for a in agents] == ["agent-0", "agent-1", "agent-2"]
+        assert world.registry.count_agents() == 3
+        
+        # A batch with a taken ID registers nothing
+        with pytest.raises(ValueError, match="already exists"):
+            world.registry.register_agents([Agent(agent_id="agent-3"), Agent(agent_id="agent-0")])
+        assert world.registry.agent_exists("agent-3") is False
         
-        assert registry.count_agents() == 3
-        assert len(registry.list_agents()) == 3
+        with pytest.raises(ValueError, match="Duplicate"):
+            world.registry.register_agents([Agent(agent_id="agent-4"), Agent(agent_id="agent-4")])
     
-    def test_delete_agent(self, registry):
+    def test_update_policy(self, world):
+        """Test changing validated policy fields by agent ID."""
+        agent = Agent(agent_id="test-agent")
+        world.registry.register_agent(agent)
+        
+        updated = world.registry.update_policy("test-agent", paused=True, max_per_transaction=1000)
+        
+        assert updated is agent
+        assert agent.policy.paused is True
+        assert agent.policy.max_per_transaction == 1000
+        
+        with pytest.raises(ValueError, match="does not exist"):
+            world.registry.update_policy("nonexistent", paused=True)
+        
+        # Values are validated, and a rejected update leaves the policy unchanged
+        with pytest.raises(ValueError):
+            world.registry.update_policy("test-agent", max_per_transaction=-5)
+        with pytest.raises(ValueError, match="Unknown policy field"):
+            world.registry.update_policy("test-agent", max_amount=1000)
+        assert agent.policy.max_per_transaction == 1000
+        
+        # Inputs are coerced to the field types
+        world.registry.update_policy("test-agent", allowlist=["bob"])
+        assert agent.policy.allowlist == {"bob"}
+    
+    def test_delete_agent(self, world):
         """Test deleting an agent."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
+        world.registry.register_agent(agent)
         
-        deleted = registry.delete_agent("test-agent")
+        deleted = world.registry.delete_agent("test-agent")
         assert deleted is True
-        assert registry.agent_exists("test-agent") is False
+        assert world.registry.agent_exists("test-agent") is False
         
         # Deleting again returns False
-        deleted_again = registry.delete_agent("test-agent")
+        deleted_again = world.registry.delete_agent("test-agent")
         assert deleted_again is False
 
 
 class TestLedgerManager:
     """Tests for LedgerManager."""
     
-    def test_record_top_up(self, registry, ledger):
+    def test_record_top_up(self, world):
         """Test recording a top-up."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
+        world.registry.register_agent(agent)
         
-        entry = ledger.record_top_up("test-agent", 10000, "topup-1")
+        entry = world.ledger.record_top_up("test-agent", 10000, "topup-1")
         
         assert entry.agent_id == "test-agent"
         assert entry.delta_amount == 10000
         assert entry.balance_after == 10000
         
         # Verify wallet was updated
-        updated_agent = registry.get_agent("test-agent")
+        updated_agent = world.registry.get_agent("test-agent")
         assert updated_agent.wallet.balance == 10000
     
-    def test_record_payment(self, registry, ledger):
+    def test_record_payment(self, world):
         """Test recording a payment."""
         alice = Agent(agent_id="alice")
         bob = Agent(agent_id="bob")
-        registry.register_agent(alice)
-        registry.register_agent(bob)
+        world.registry.register_agent(alice)
+        world.registry.register_agent(bob)
         
         # Fund Alice
-        ledger.record_top_up("alice", 10000, "topup-1")
+        world.ledger.record_top_up("alice", 10000, "topup-1")
         
         # Payment Alice -> Bob
-        entries = ledger.record_payment("alice", "bob", 5000, "payment-1")
+        entries = world.ledger.record_payment("alice", "bob", 5000, "payment-1")
         
         assert len(entries) == 2
         assert entries[0].delta_amount == -5000  # Alice debit
         assert entries[1].delta_amount == 5000   # Bob credit
         
         # Verify wallets
-        alice = registry.get_agent("alice")
-        bob = registry.get_agent("bob")
         assert alice.wallet.balance == 5000
         assert bob.wallet.balance == 5000
     
-    def test_payment_insufficient_funds(self, registry, ledger):
+    def test_payment_insufficient_funds(self, world):
         """Test payment fails with insufficient funds."""
         alice = Agent(agent_id="alice")
         bob = Agent(agent_id="bob")
-        registry.register_agent(alice)
-        registry.register_agent(bob)
+        world.registry.register_agent(alice)
+        world.registry.register_agent(bob)
         
-        ledger.record_top_up("alice", 1000, "topup-1")
+        world.ledger.record_top_up("alice", 1000, "topup-1")
         
         with pytest.raises(ValueError, match="Insufficient funds"):
-            ledger.record_payment("alice", "bob", 2000, "payment-1")
+            world.ledger.record_payment("alice", "bob", 2000, "payment-1")
     
-    def test_escrow_lock(self, registry, ledger):
+    def test_escrow_lock(self, world):
         """Test locking funds in escrow."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
-        ledger.record_top_up("test-agent", 10000, "topup-1")
+        world.registry.register_agent(agent)
+        world.ledger.record_top_up("test-agent", 10000, "topup-1")
         
-        entry = ledger.record_escrow_lock("test-agent", 3000, "escrow-1")
+        entry = world.ledger.record_escrow_lock("test-agent", 3000, "escrow-1")
         
         assert entry.delta_amount == -3000
         
         # Verify wallet
-        agent = registry.get_agent("test-agent")
         assert agent.wallet.balance == 7000
         assert agent.wallet.hold == 3000
     
-    def test_escrow_release(self, registry, ledger):
+    def test_escrow_release(self, world):
         """Test releasing escrow to recipient."""
         alice = Agent(agent_id="alice")
         bob = Agent(agent_id="bob")
-        registry.register_agent(alice)
-        registry.register_agent(bob)
+        world.registry.register_agent(alice)
+        world.registry.register_agent(bob)
         
-        ledger.record_top_up("alice", 10000, "topup-1")
-        ledger.record_escrow_lock("alice", 3000, "escrow-1")
+        world.ledger.record_top_up("alice", 10000, "topup-1")
+        world.ledger.record_escrow_lock("alice", 3000, "escrow-1")
         
-        entries = ledger.record_escrow_release("alice", "bob", 3000, "escrow-1")
+        entries = world.ledger.record_escrow_release("alice", "bob", 3000, "escrow-1")
         
         assert len(entries) == 2
         
         # Verify wallets
-        alice = registry.get_agent("alice")
-        bob = registry.get_agent("bob")
         assert alice.wallet.balance == 7000
         assert alice.wallet.hold == 0
         assert bob.wallet.balance == 3000
     
-    def test_escrow_cancel(self, registry, ledger):
+    def test_escrow_cancel(self, world):
         """Test cancelling escrow."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
-        ledger.record_top_up("test-agent", 10000, "topup-1")
-        ledger.record_escrow_lock("test-agent", 3000, "escrow-1")
+        world.registry.register_agent(agent)
+        world.ledger.record_top_up("test-agent", 10000, "topup-1")
+        world.ledger.record_escrow_lock("test-agent", 3000, "escrow-1")
         
-        entry = ledger.record_escrow_cancel("test-agent", 3000, "escrow-1")
+        entry = world.ledger.record_escrow_cancel("test-agent", 3000, "escrow-1")
         
         assert entry.delta_amount == 3000
         
         # Verify wallet
-        agent = registry.get_agent("test-agent")
         assert agent.wallet.balance == 10000
         assert agent.wallet.hold == 0
     
-    def test_get_agent_ledger_entries(self, registry, ledger):
+    def test_get_agent_ledger_entries(self, world):
         """Test retrieving agent's transaction history."""
         agent = Agent(agent_id="test-agent")
-        registry.register_agent(agent)
+        world.registry.register_agent(agent)
         
-        ledger.record_top_up("test-agent", 10000, "topup-1")
-        ledger.record_top_up("test-agent", 5000, "topup-2")
+        world.ledger.record_top_up("test-agent", 10000, "topup-1")
+        world.ledger.record_top_up("test-agent", 5000, "topup-2")
         
-        entries = ledger.get_agent_ledger_entries("test-agent")
+        entries = world.ledger.get_agent_ledger_entries("test-agent")
         assert len(entries) == 2
+        assert world.ledger.get_agent_ledger_entries("nonexistent") == []
+        
+        # Returned lists are copies; the ledger's own history is unchanged
+        entries.clear()
+        assert len(world.ledger.get_agent_ledger_entries("test-agent")) == 2
+        
+        # Clearing the ledger empties the lookups too
+        world.ledger.clear()
+        assert world.ledger.get_agent_ledger_entries("test-agent") == []
+        assert world.ledger.get_entries_by_reference("topup-1") == []
     
-    def test_verify_double_entry(self, registry, ledger):
+    def test_verify_double_entry(self, world):
         """Test double-entry verification."""
         alice = Agent(agent_id="alice")
         bob = Agent(agent_id="bob")
-        registry.register_agent(alice)
-        registry.register_agent(bob)
+        world.registry.register_agent(alice)
+        world.registry.register_agent(bob)
         
-        ledger.record_top_up("alice", 10000, "topup-1")
-        ledger.record_payment("alice", "bob", 5000, "payment-1")
+        world.ledger.record_top_up("alice", 10000, "topup-1")
+        world.ledger.record_payment("alice", "bob", 5000, "payment-1")
         
         # Payment should sum to zero
-        assert ledger.verify_double_entry("payment-1") is True
+        assert world.ledger.verify_double_entry("payment-1") is True
         
         # Top-up is exempt from zero-sum
-        assert ledger.verify_double_entry("topup-1") is True
+        assert world.ledger.verify_double_entry("topup-1") is True
+    
+    def test_verify_all_double_entries(self, funded_agents, world):
+        """Test verifying every transaction in one pass."""
+        world.payment_engine.execute_payment(
+            PaymentIntent(from_agent_id="alice", to_agent_id="bob", amount=2000)
+        )
+        released = world.escrow_manager.create_escrow("alice", "bob", 1000).escrow
+        world.escrow_manager.release_escrow(released.escrow_id)
+        cancelled = world.escrow_manager.create_escrow("alice", "bob", 1000).escrow
+        world.escrow_manager.cancel_escrow(cancelled.escrow_id)
+        world.escrow_manager.create_escrow("alice", "bob", 3000)  # still locked
+        
+        assert world.ledger.verify_all_double_entries() is True
+        
+        # An unbalanced transaction (a cancel with no matching lock) fails the whole ledger
+        world.ledger.record_escrow_cancel("alice", 1000, "orphan-cancel")
+        assert world.ledger.verify_all_double_entries() is False
 
 
 class TestPaymentEngine:
     """Tests for PaymentEngine."""
     
-    def test_successful_payment(self, funded_agents, payment_engine, registry):
+    def test_successful_payment(self, funded_agents, world):
         """Test successful payment execution."""
         alice, bob = funded_agents
         
@@ -263,91 +335,48 @@ class TestPaymentEngine:
             memo="Test payment"
         )
         
-        result = payment_engine.execute_payment(intent)
+        result = world.payment_engine.execute_payment(intent)
         
         assert result.success is True
         assert result.payment_intent.status == PaymentStatus.COMPLETED
         
         # Verify balances
-        alice = registry.get_agent("alice")
-        bob = registry.get_agent("bob")
         assert alice.wallet.balance == 5000
         assert bob.wallet.balance == 5000
     
-    def test_payment_insufficient_funds(self, funded_agents, payment_engine):
-        """Test payment fails with insufficient funds."""
-        alice, bob = funded_agents
-        
-        intent = PaymentIntent(
-            from_agent_id="alice",
-            to_agent_id="bob",
-            amount=20000  # More than Alice has
-        )
-        
-        result = payment_engine.execute_payment(intent)
-        
-        assert result.success is False
-        assert result.error_code == "INSUFFICIENT_FUNDS"
-        assert result.payment_intent.status == PaymentStatus.FAILED_FUNDS
-    
-    def test_payment_agent_paused(self, funded_agents, payment_engine, registry):
-        """Test payment fails when agent is paused."""
-        alice, bob = funded_agents
-        
-        # Pause Alice
-        alice.policy.paused = True
-        registry.update_agent(alice)
-        
-        intent = PaymentIntent(
-            from_agent_id="alice",
-            to_agent_id="bob",
-            amount=1000
-        )
-        
-        result = payment_engine.execute_payment(intent)
-        
-        assert result.success is False
-        assert result.error_code == "AGENT_PAUSED"
-    
-    def test_payment_recipient_not_allowed(self, funded_agents, payment_engine, registry):
-        """Test payment fails when recipient not in allowlist."""
-        alice, bob = funded_agents
-        
-        # Set allowlist that doesn't include Bob
-        alice.policy.allowlist = {"charlie"}
-        registry.update_agent(alice)
-        
-        intent = PaymentIntent(
-            from_agent_id="alice",
-            to_agent_id="bob",
-            amount=1000
-        )
-        
-        result = payment_engine.execute_payment(intent)
-        
-        assert result.success is False
-        assert result.error_code == "RECIPIENT_NOT_ALLOWED"
-    
-    def test_payment_exceeds_limit(self, funded_agents, payment_engine, registry):
-        """Test payment fails when amount exceeds limit."""
+    @pytest.mark.parametrize("from_agent_id,policy_changes,amount,error_code,status", [
+        pytest.param("alice", {}, 20000, "INSUFFICIENT_FUNDS", PaymentStatus.FAILED_FUNDS,
+                     id="insufficient-funds"),
+        pytest.param("alice", {"paused": True}, 1000, "AGENT_PAUSED", PaymentStatus.FAILED_POLICY,
+                     id="paused"),
+        # Allowlist that doesn't include Bob
+        pytest.param("alice", {"allowlist": {"charlie"}}, 1000, "RECIPIENT_NOT_ALLOWED",
+                     PaymentStatus.FAILED_POLICY, id="recipient-not-allowed"),
+        pytest.param("alice", {"max_per_transaction": 1000}, 2000, "AMOUNT_EXCEEDS_LIMIT",
+                     PaymentStatus.FAILED_POLICY, id="exceeds-limit"),
+        pytest.param("nonexistent", {}, 1000, "PAYER_NOT_FOUND", PaymentStatus.FAILED_POLICY,
+                     id="payer-not-found"),
+    ])
+    def test_payment_failure(self, funded_agents, world, from_agent_id,
+                             policy_changes, amount, error_code, status):
+        """Test payments rejected for funds, policy, or an unknown payer."""
         alice, bob = funded_agents
         
-        # Set transaction limit
-        alice.policy.max_per_transaction = 1000
-        registry.update_agent(alice)
+        world.registry.update_policy("alice", **policy_changes)
         
         intent = PaymentIntent(
-            from_agent_id="alice",
+            from_agent_id=from_agent_id,
             to_agent_id="bob",
-            amount=2000
+            amount=amount
         )
         
-        result = payment_engine.execute_payment(intent)
+        result = world.payment_engine.execute_payment(intent)
         
         assert result.success is False
-        assert result.error_code == "AMOUNT_EXCEEDS_LIMIT"
+        assert result.error_code == error_code
+        assert result.payment_intent.status == status
     
-    def test_payment_idempotency(self, funded_agents, payment_engine):
+    def test_payment_idempotency(self, funded_agents, world):
         """Test idempotent payment execution."""
         alice, bob = funded_agents
         
@@ -359,36 +388,23 @@ class TestPaymentEngine:
         )
         
         # First execution
-        result1 = payment_engine.execute_payment(intent)
+        result1 = world.payment_engine.execute_payment(intent)
         assert result1.success is True
         
         # Second execution with same key should return cached result
-        result2 = payment_engine.execute_payment(intent)
+        result2 = world.payment_engine.execute_payment(intent)
         assert result2.success is True
         assert result2.payment_intent.intent_id == result1.payment_intent.intent_id
-    
-    def test_payment_payer_not_found(self, payment_engine):
-        """Test payment fails when payer doesn't exist."""
-        intent = PaymentIntent(
-            from_agent_id="nonexistent",
-            to_agent_id="bob",
-            amount=1000
-        )
-        
-        result = payment_engine.execute_payment(intent)
-        
-        assert result.success is False
-        assert result.error_code == "PAYER_NOT_FOUND"
 
 
 class TestEscrowManager:
     """Tests for EscrowManager."""
     
-    def test_create_escrow(self, funded_agents, escrow_manager, registry):
+    def test_create_escrow(self, funded_agents, world):
         """Test creating an escrow."""
         alice, bob = funded_agents
         
-        result = escrow_manager.create_escrow(
+        result = world.escrow_manager.create_escrow(
             from_agent_id="alice",
             to_agent_id="bob",
             amount=3000,
@@ -398,18 +414,18 @@ class TestEscrowManager:
         assert result.success is True
         assert result.escrow.status == EscrowStatus.LOCKED
         assert result.escrow.amount == 3000
+        assert result.escrow.escrow_id == "escrow-0"  # from the world's id_factory
         
         # Verify Alice's wallet
-        alice = registry.get_agent("alice")
         assert alice.wallet.balance == 7000
         assert alice.wallet.hold == 3000
     
-    def test_release_escrow(self, funded_agents, escrow_manager, registry):
+    def test_release_escrow(self, funded_agents, world):
         """Test releasing an escrow."""
         alice, bob = funded_agents
         
         # Create escrow
-        create_result = escrow_manager.create_escrow(
+        create_result = world.escrow_manager.create_escrow(
             from_agent_id="alice",
             to_agent_id="bob",
             amount=3000
@@ -417,24 +433,22 @@ class TestEscrowManager:
         escrow_id = create_result.escrow.escrow_id
         
         # Release it
-        release_result = escrow_manager.release_escrow(escrow_id)
+        release_result = world.escrow_manager.release_escrow(escrow_id)
         
         assert release_result.success is True
         assert release_result.escrow.status == EscrowStatus.RELEASED
         
         # Verify wallets
-        alice = registry.get_agent("alice")
-        bob = registry.get_agent("bob")
         assert alice.wallet.balance == 7000
         assert alice.wallet.hold == 0
         assert bob.wallet.balance == 3000
     
-    def test_cancel_escrow(self, funded_agents, escrow_manager, registry):
+    def test_cancel_escrow(self, funded_agents, world):
         """Test cancelling an escrow."""
         alice, bob = funded_agents
         
         # Create escrow
-        create_result = escrow_manager.create_escrow(
+        create_result = world.escrow_manager.create_escrow(
             from_agent_id="alice",
             to_agent_id="bob",
             amount=3000
@@ -442,21 +456,20 @@ class TestEscrowManager:
         escrow_id = create_result.escrow.escrow_id
         
         # Cancel it
-        cancel_result = escrow_manager.cancel_escrow(escrow_id)
+        cancel_result = world.escrow_manager.cancel_escrow(escrow_id)
         
         assert cancel_result.success is True
         assert cancel_result.escrow.status == EscrowStatus.CANCELLED
         
         # Verify Alice's wallet - funds returned
-        alice = registry.get_agent("alice")
         assert alice.wallet.balance == 10000
         assert alice.wallet.hold == 0
     
-    def test_escrow_insufficient_funds(self, funded_agents, escrow_manager):
+    def test_escrow_insufficient_funds(self, funded_agents, world):
         """Test escrow creation fails with insufficient funds."""
         alice, bob = funded_agents
         
-        result = escrow_manager.create_escrow(
+        result = world.escrow_manager.create_escrow(
             from_agent_id="alice",
             to_agent_id="bob",
             amount=20000  # More than Alice has
@@ -465,18 +478,18 @@ class TestEscrowManager:
         assert result.success is False
         assert result.error_code == "INSUFFICIENT_FUNDS"
     
-    def test_release_nonexistent_escrow(self, escrow_manager):
+    def test_release_nonexistent_escrow(self, world):
         """Test releasing non-existent escrow fails."""
-        result = escrow_manager.release_escrow("nonexistent")
+        result = world.escrow_manager.release_escrow("nonexistent")
         
         assert result.success is False
         assert result.error_code == "ESCROW_NOT_FOUND"
     
-    def test_release_already_completed_escrow(self, funded_agents, escrow_manager):
+    def test_release_already_completed_escrow(self, funded_agents, world):
         """Test releasing already-completed escrow fails."""
         alice, bob = funded_agents
         
-        create_result = escrow_manager.create_escrow(
+        create_result = world.escrow_manager.create_escrow(
             from_agent_id="alice",
             to_agent_id="bob",
             amount=1000
@@ -484,47 +497,53 @@ class TestEscrowManager:
         escrow_id = create_result.escrow.escrow_id
         
         # Release once
-        escrow_manager.release_escrow(escrow_id)
+        world.escrow_manager.release_escrow(escrow_id)
         
         # Try to release again
-        result = escrow_manager.release_escrow(escrow_id)
+        result = world.escrow_manager.release_escrow(escrow_id)
         assert result.success is False
         assert result.error_code == "ESCROW_NOT_LOCKED"
     
-    def test_list_escrows(self, funded_agents, escrow_manager):
+    def test_list_escrows(self, funded_agents, world):
         """Test listing escrows."""
         alice, bob = funded_agents
         
         # Create multiple escrows
-        escrow_manager.create_escrow("alice", "bob", 1000)
-        escrow_manager.create_escrow("alice", "bob", 2000)
+        first = world.escrow_manager.create_escrow("alice", "bob", 1000).escrow
+        world.escrow_manager.create_escrow("alice", "bob", 2000)
         
         # List by payer
-        alice_escrows = escrow_manager.list_escrows_by_payer("alice")
+        alice_escrows = world.escrow_manager.list_escrows_by_payer("alice")
         assert len(alice_escrows) == 2
         
         # List by recipient
-        bob_escrows = escrow_manager.list_escrows_by_recipient("bob")
+        bob_escrows = world.escrow_manager.list_escrows_by_recipient("bob")
         assert len(bob_escrows) == 2
         
         # List by status
-        locked = escrow_manager.list_escrows_by_status(EscrowStatus.LOCKED)
+        locked = world.escrow_manager.list_escrows_by_status(EscrowStatus.LOCKED)
         assert len(locked) == 2
+        
+        # Settled escrows move to their new status
+        world.escrow_manager.release_escrow(first.escrow_id)
+        assert len(world.escrow_manager.list_escrows_by_status(EscrowStatus.LOCKED)) == 1
+        assert world.escrow_manager.list_escrows_by_status(EscrowStatus.RELEASED) == [first]
+        assert world.escrow_manager.list_escrows_by_status(EscrowStatus.CANCELLED) == []
 
 
 class TestEndToEndScenarios:
     """End-to-end integration tests."""
     
-    def test_complete_payment_flow(self, registry, ledger, payment_engine):
+    def test_complete_payment_flow(self, world):
         """Test complete payment flow from registration to payment."""
         # Setup
-        alice = Agent(agent_id="alice", metadata={"name": "Alice"})
-        bob = Agent(agent_id="bob", metadata={"name": "Bob"})
-        registry.register_agent(alice)
-        registry.register_agent(bob)
+        alice = Agent(agent_id="alice", metadata=_META_ALICE)
+        bob = Agent(agent_id="bob", metadata=_META_BOB)
+        world.registry.register_agent(alice)
+        world.registry.register_agent(bob)
         
         # Fund Alice
-        ledger.record_top_up("alice", 10000, "topup-1", "Initial funding")
+        world.ledger.record_top_up("alice", 10000, "topup-1", "Initial funding")
         
         # Create and execute payment
         intent = PaymentIntent(
@@ -534,32 +553,30 @@ class TestEndToEndScenarios:
             memo="Payment for services"
         )
         
-        result = payment_engine.execute_payment(intent)
+        result = world.payment_engine.execute_payment(intent)
         assert result.success is True
         
         # Verify ledger entries
-        alice_entries = ledger.get_agent_ledger_entries("alice")
-        bob_entries = ledger.get_agent_ledger_entries("bob")
+        alice_entries = world.ledger.get_agent_ledger_entries("alice")
+        bob_entries = world.ledger.get_agent_ledger_entries("bob")
         assert len(alice_entries) == 2  # Top-up + payment
         assert len(bob_entries) == 1    # Payment received
         
         # Verify final balances
-        alice = registry.get_agent("alice")
-        bob = registry.get_agent("bob")
         assert alice.wallet.balance == 7000
         assert bob.wallet.balance == 3000
     
-    def test_complete_escrow_flow(self, registry, ledger, escrow_manager):
+    def test_complete_escrow_flow(self, world):
         """Test complete escrow flow from creation to release."""
         # Setup
         alice = Agent(agent_id="alice")
         bob = Agent(agent_id="bob")
-        registry.register_agent(alice)
-        registry.register_agent(bob)
-        ledger.record_top_up("alice", 10000, "topup-1")
+        world.registry.register_agent(alice)
+        world.registry.register_agent(bob)
+        world.ledger.record_top_up("alice", 10000, "topup-1")
         
         # Create escrow
-        create_result = escrow_manager.create_escrow(
+        create_result = world.escrow_manager.create_escrow(
             from_agent_id="alice",
             to_agent_id="bob",
             amount=5000,
@@ -569,58 +586,51 @@ class TestEndToEndScenarios:
         escrow_id = create_result.escrow.escrow_id
         
         # Verify Alice's wallet after lock
-        alice = registry.get_agent("alice")
         assert alice.wallet.balance == 5000
         assert alice.wallet.hold == 5000
         
         # Release escrow
-        release_result = escrow_manager.release_escrow(escrow_id)
+        release_result = world.escrow_manager.release_escrow(escrow_id)
         assert release_result.success is True
         
         # Verify final wallets
-        alice = registry.get_agent("alice")
-        bob = registry.get_agent("bob")
         assert alice.wallet.balance == 5000
         assert alice.wallet.hold == 0
         assert bob.wallet.balance == 5000
         
         # Verify ledger
-        entries = ledger.get_entries_by_reference(escrow_id)
+        entries = world.ledger.get_entries_by_reference(escrow_id)
         assert len(entries) == 3  # Lock + 2 for release
     
-    def test_mixed_payment_and_escrow(self, registry, ledger, payment_engine, escrow_manager):
+    def test_mixed_payment_and_escrow(self, world):
         """Test mixing regular payments and escrow operations."""
         # Setup
         alice = Agent(agent_id="alice")
         bob = Agent(agent_id="bob")
-        registry.register_agent(alice)
-        registry.register_agent(bob)
-        ledger.record_top_up("alice", 10000, "topup-1")
+        world.registry.register_agent(alice)
+        world.registry.register_agent(bob)
+        world.ledger.record_top_up("alice", 10000, "topup-1")
         
         # Regular payment
         intent = PaymentIntent(from_agent_id="alice", to_agent_id="bob", amount=2000)
-        result = payment_engine.execute_payment(intent)
+        result = world.payment_engine.execute_payment(intent)
         assert result.success is True
         
         # Create escrow
-        escrow_result = escrow_manager.create_escrow("alice", "bob", 3000)
+        escrow_result = world.escrow_manager.create_escrow("alice", "bob", 3000)
         assert escrow_result.success is True
         
         # Verify Alice's state
-        alice = registry.get_agent("alice")
         assert alice.wallet.balance == 5000  # 10000 - 2000 (paid) - 3000 (locked)
         assert alice.wallet.hold == 3000
         
         # Bob should have received the payment but not escrow yet
-        bob = registry.get_agent("bob")
         assert bob.wallet.balance == 2000
         
         # Release escrow
-        escrow_manager.release_escrow(escrow_result.escrow.escrow_id)
+        world.escrow_manager.release_escrow(escrow_result.escrow.escrow_id)
         
         # Final balances
-        alice = registry.get_agent("alice")
-        bob = registry.get_agent("bob")
         assert alice.wallet.balance == 5000
         assert alice.wallet.hold == 0
         assert bob.wallet.balance == 5000